@@ -69,8 +69,7 @@ class PromptManager:
         Returns:
             Formatted prompt string
         """
-        template = self.prompts.blogger_article_prompt
-        return template.format(topic=topic, source_summary=source_summary)
+        return self.prompts.render("blogger_article_prompt", topic=topic, source_summary=source_summary)
 
     def get_telegram_prompt(self, topic: str, article_url: str) -> str:
         """
@@ -83,8 +82,7 @@ class PromptManager:
         Returns:
             Formatted prompt string
         """
-        template = self.prompts.telegram_post_prompt
-        return template.format(topic=topic, article_url=article_url)
+        return self.prompts.render("telegram_post_prompt", topic=topic, article_url=article_url)
 
     def get_facebook_prompt(self, topic: str, article_url: str) -> str:
         """
@@ -97,8 +95,7 @@ class PromptManager:
         Returns:
             Formatted prompt string
         """
-        template = self.prompts.facebook_post_prompt
-        return template.format(topic=topic, article_url=article_url)
+        return self.prompts.render("facebook_post_prompt", topic=topic, article_url=article_url)
 
     def get_devto_prompt(self, topic: str, source_summary: str) -> str:
         """
@@ -111,8 +108,7 @@ class PromptManager:
         Returns:
             Formatted prompt string
         """
-        template = self.prompts.devto_article_prompt
-        return template.format(topic=topic, source_summary=source_summary)
+        return self.prompts.render("devto_article_prompt", topic=topic, source_summary=source_summary)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # SYSTEM PROMPTS
@@ -106,9 +106,7 @@ class ConfigManager:
         try:
             # Load main config
             if self.config_path.exists():
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    config_data = json.load(f)
-                self.app_config = AppConfig(**config_data)
+                self.app_config = AppConfig.from_raw(self.config_path.read_bytes())
 
                 # Sync Sheet Name/ID from Config
                 if hasattr(self.app_config, "google_sheet_name"):
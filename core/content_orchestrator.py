@@ -843,41 +843,22 @@ class ContentOrchestrator:
         Returns:
             Dict of {platform: is_working}
         """
-        results = {}
 
-        # Test Groq/LLM
-        try:
+        async def _llm_ok() -> bool:
             test = await self.llm._generate("Say 'OK'", max_tokens=10)
-            results["groq"] = "ok" in test.lower()
-        except:
-            results["groq"] = False
-
-        # Test Blogger
-        try:
-            info = await self.blogger.get_blog_info()
-            results["blogger"] = info is not None
-        except:
-            results["blogger"] = False
-
-        # Test Dev.to
-        try:
-            info = await self.devto.get_user_info()
-            results["devto"] = info is not None
-        except:
-            results["devto"] = False
+            return "ok" in test.lower()
 
-        # Test Telegram
-        try:
-            info = await self.telegram.get_channel_info()
-            results["telegram"] = info is not None
-        except:
-            results["telegram"] = False
+        async def _responds(probe) -> bool:
+            return await probe is not None
 
-        # Test Facebook
-        try:
-            info = await self.facebook.get_page_info()
-            results["facebook"] = info is not None
-        except:
-            results["facebook"] = False
+        probes = {
+            "groq": _llm_ok(),
+            "blogger": _responds(self.blogger.get_blog_info()),
+            "devto": _responds(self.devto.get_user_info()),
+            "telegram": _responds(self.telegram.get_channel_info()),
+            "facebook": _responds(self.facebook.get_page_info()),
+        }
 
-        return results
+        # The checks are independent, so run them concurrently
+        outcomes = await asyncio.gather(*probes.values(), return_exceptions=True)
+        return {name: outcome is True for name, outcome in zip(probes, outcomes)}
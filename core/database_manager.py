@@ -868,6 +868,16 @@ class DatabaseManager:
     # STATISTICS
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @staticmethod
+    def _parse_timestamp(value: Any) -> Optional[datetime]:
+        """SQLite aggregates return timestamps as text; parse them back"""
+        if value is None or isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+
     def get_stats(self) -> SystemStats:
         """Get comprehensive system statistics for dashboard"""
         now = datetime.utcnow()
@@ -947,8 +957,8 @@ class DatabaseManager:
             errors_this_week=errors_week,
             queue_size=queue_size,
             active_feeds=0,  # Will be filled from ConfigManager
-            last_post_time=last_post,
-            last_error_time=last_error,
+            last_post_time=self._parse_timestamp(last_post),
+            last_error_time=self._parse_timestamp(last_error),
             system_uptime_hours=round(uptime_hours, 2),
             is_running=self.is_bot_running(),
         )
@@ -5,10 +5,39 @@ Data validation and serialization models for the entire system.
 Using Pydantic for type safety and automatic validation.
 """
 
-from pydantic import BaseModel, Field, HttpUrl, SecretStr, validator
-from typing import Optional, List, Dict, Any
+from pydantic import (
+    BaseModel,
+    Field,
+    HttpUrl,
+    SecretStr,
+    TypeAdapter,
+    model_validator,
+    validator,
+)
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+import hashlib
+import os
+import re
+import sys
+
+
+def _schema_example(factory):
+    """
+    Build a `json_schema_extra` hook that adds an example lazily.
+
+    The example dict is only built when a schema is exported with
+    EXPORT_OPENAPI set, so it isn't kept alive on every model class.
+    """
+
+    def _extra(schema: Dict[str, Any]) -> None:
+        if os.environ.get("EXPORT_OPENAPI"):
+            schema["example"] = factory()
+
+    return staticmethod(_extra)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -73,15 +102,20 @@ class TelegramConfig(BaseModel):
     admin_user_ids: List[int] = Field(
         default_factory=list, description="Admin user IDs for notifications"
     )
+    trusted_image_hosts: List[str] = Field(
+        default_factory=list,
+        description="Image hosts Telegram fetches directly (no download/re-upload)",
+    )
 
     class Config:
-        json_schema_extra = {
-            "example": {
+        json_schema_extra = _schema_example(
+            lambda: {
                 "bot_token": "123456789:ABCdefGHIjklMNOpqrSTUvwxYZ",
                 "channel_id": "@mychannel",
                 "admin_user_ids": [123456789],
+                "trusted_image_hosts": ["res.cloudinary.com", "i.imgur.com"],
             }
-        }
+        )
 
 
 class BloggerConfig(BaseModel):
@@ -91,16 +125,19 @@ class BloggerConfig(BaseModel):
     client_id: str = Field(..., description="Google OAuth Client ID")
     client_secret: str = Field(..., description="Google OAuth Client Secret")
     refresh_token: str = Field(..., description="OAuth Refresh Token")
+    rate_limit: int = Field(
+        default=1, ge=1, description="Max Blogger API requests per second"
+    )
 
     class Config:
-        json_schema_extra = {
-            "example": {
+        json_schema_extra = _schema_example(
+            lambda: {
                 "blog_id": "1234567890123456789",
                 "client_id": "xxx.apps.googleusercontent.com",
                 "client_secret": "GOCSPX-xxx",
                 "refresh_token": "1//xxx",
             }
-        }
+        )
 
 
 class DevToConfig(BaseModel):
@@ -110,9 +147,14 @@ class DevToConfig(BaseModel):
     organization_id: Optional[str] = Field(
         None, description="Organization ID (optional)"
     )
+    rate_limit: int = Field(
+        default=10, ge=1, description="Max Dev.to API requests per 30 seconds"
+    )
 
     class Config:
-        json_schema_extra = {"example": {"api_key": "xxx", "organization_id": None}}
+        json_schema_extra = _schema_example(
+            lambda: {"api_key": "xxx", "organization_id": None}
+        )
 
 
 class FacebookConfig(BaseModel):
@@ -122,9 +164,9 @@ class FacebookConfig(BaseModel):
     page_access_token: str = Field(..., description="Page Access Token")
 
     class Config:
-        json_schema_extra = {
-            "example": {"page_id": "123456789", "page_access_token": "EAABxxx"}
-        }
+        json_schema_extra = _schema_example(
+            lambda: {"page_id": "123456789", "page_access_token": "EAABxxx"}
+        )
 
 
 class GroqConfig(BaseModel):
@@ -142,14 +184,14 @@ class GroqConfig(BaseModel):
     )
 
     class Config:
-        json_schema_extra = {
-            "example": {
+        json_schema_extra = _schema_example(
+            lambda: {
                 "api_key": "gsk_xxx",
                 "model": "llama-3.1-70b-versatile",
                 "temperature": 0.7,
                 "max_tokens": 4096,
             }
-        }
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -182,6 +224,10 @@ class RSSFeed(BaseModel):
             raise ValueError("URL must start with http:// or https://")
         return v
 
+    @validator("language")
+    def _intern_language(cls, v: str):
+        return sys.intern(v)
+
 
 class FetchedArticle(BaseModel):
     """Article fetched from RSS feed"""
@@ -201,6 +247,23 @@ class FetchedArticle(BaseModel):
     word_count: int = Field(default=0, description="Content word count")
     language: str = Field(default="ar", description="Detected language")
 
+    @validator("language")
+    def _intern_language(cls, v: str):
+        return sys.intern(v)
+
+    @classmethod
+    def validate_batch(cls, raw: List[Dict[str, Any]]) -> List["FetchedArticle"]:
+        """
+        Validate a whole batch of raw article dicts in one pydantic-core call.
+
+        Validation is strict (no type coercion), so inputs must already carry
+        the right types (e.g. `datetime` objects, not ISO strings).
+        """
+        return _BATCH_ADAPTER.validate_python(raw, strict=True)
+
+
+_BATCH_ADAPTER = TypeAdapter(List[FetchedArticle])
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONTENT PIPELINE MODELS
@@ -252,6 +315,31 @@ class ContentQueueItem(BaseModel):
     max_attempts: int = Field(default=3)
 
 
+class ContentQueueItemRaw(BaseModel):
+    """Queue item carrying the article as JSON bytes (validated on dequeue)"""
+
+    id: Optional[str] = Field(None)
+    article_json: bytes
+    priority: int = Field(default=5, ge=1, le=10)
+    status: PostStatus = Field(default=PostStatus.PENDING)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    scheduled_for: Optional[datetime] = Field(None)
+    attempts: int = Field(default=0)
+    max_attempts: int = Field(default=3)
+
+    @classmethod
+    def from_item(cls, item: ContentQueueItem) -> "ContentQueueItemRaw":
+        """Serialize a ContentQueueItem for the wire"""
+        return cls(
+            article_json=item.article.model_dump_json().encode(),
+            **item.model_dump(exclude={"article"}),
+        )
+
+    def load_article(self) -> FetchedArticle:
+        """Validate the article straight from its JSON bytes"""
+        return FetchedArticle.model_validate_json(self.article_json)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SYSTEM LOGGING MODELS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -269,37 +357,47 @@ class SystemLog(BaseModel):
     details: Optional[Dict[str, Any]] = Field(default_factory=dict)
     error_traceback: Optional[str] = Field(None)
 
+    # Component/action take a handful of distinct values across many rows
+    @validator("component", "action")
+    def _intern_tag(cls, v: str):
+        return sys.intern(v)
+
     class Config:
-        json_schema_extra = {
-            "example": {
+        json_schema_extra = _schema_example(
+            lambda: {
                 "level": "info",
                 "component": "publisher",
                 "action": "publish_to_blogger",
                 "message": "Successfully published article",
                 "details": {"blogger_url": "https://..."},
             }
-        }
+        )
+
 
+@dataclass(slots=True)
+class SystemStats:
+    """System statistics for dashboard (plain dataclass - no validation needed)"""
 
-class SystemStats(BaseModel):
-    """System statistics for dashboard"""
+    posts_today: int = 0
+    posts_this_week: int = 0
+    posts_this_month: int = 0
+    total_posts: int = 0
 
-    posts_today: int = Field(default=0)
-    posts_this_week: int = Field(default=0)
-    posts_this_month: int = Field(default=0)
-    total_posts: int = Field(default=0)
+    errors_today: int = 0
+    errors_this_week: int = 0
 
-    errors_today: int = Field(default=0)
-    errors_this_week: int = Field(default=0)
+    queue_size: int = 0
+    active_feeds: int = 0
 
-    queue_size: int = Field(default=0)
-    active_feeds: int = Field(default=0)
+    last_post_time: Optional[datetime] = None
+    last_error_time: Optional[datetime] = None
 
-    last_post_time: Optional[datetime] = Field(None)
-    last_error_time: Optional[datetime] = Field(None)
+    system_uptime_hours: float = 0
+    is_running: bool = False
 
-    system_uptime_hours: float = Field(default=0)
-    is_running: bool = Field(default=False)
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a plain dict (for JSON export)"""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -307,6 +405,30 @@ class SystemStats(BaseModel):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+# `{{`/`}}` are literal braces (same as str.format); `{name}` is a placeholder.
+_PLACEHOLDER_RE = re.compile(r"\{\{|\}\}|\{(\w+)\}")
+
+
+@lru_cache(maxsize=64)
+def _compile_tmpl(s: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a prompt template once into (literal, placeholder) segments."""
+    segments: List[Tuple[str, Optional[str]]] = []
+    literal: List[str] = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(s):
+        literal.append(s[pos : match.start()])
+        key = match.group(1)
+        if key is None:
+            literal.append(match.group(0)[0])
+        else:
+            segments.append(("".join(literal), key))
+            literal = []
+        pos = match.end()
+    literal.append(s[pos:])
+    segments.append(("".join(literal), None))
+    return tuple(segments)
+
+
 class SystemPrompts(BaseModel):
     """AI System Prompts (The Persona)"""
 
@@ -391,6 +513,41 @@ Source: {source_summary}""",
         description="Prompt for Dev.to articles",
     )
 
+    def render(self, field_name: str, **ctx: Any) -> str:
+        """
+        Render a prompt field with its placeholders filled in.
+
+        Equivalent to `getattr(self, field_name).format(**ctx)` for simple
+        `{name}` placeholders, but the template is parsed only once.
+
+        Raises:
+            KeyError: If the template references a missing placeholder
+        """
+        parts: List[str] = []
+        for literal, key in _compile_tmpl(getattr(self, field_name)):
+            parts.append(literal)
+            if key is not None:
+                parts.append(str(ctx[key]))
+        return "".join(parts)
+
+
+_PLATFORM_BITS = {"blogger": 0, "devto": 1, "telegram": 2, "facebook": 3}
+
+
+def _platform_flag(bit: int) -> property:
+    """Boolean view over one bit of ScheduleConfig.enabled_platforms"""
+
+    def fget(self) -> bool:
+        return bool((self.enabled_platforms >> bit) & 1)
+
+    def fset(self, enabled: bool) -> None:
+        if enabled:
+            self.enabled_platforms |= 1 << bit
+        else:
+            self.enabled_platforms &= ~(1 << bit)
+
+    return property(fget, fset)
+
 
 class ScheduleConfig(BaseModel):
     """Scheduling configuration"""
@@ -407,11 +564,32 @@ class ScheduleConfig(BaseModel):
         default=7, ge=1, le=50, description="Maximum posts per day"
     )
 
-    # Platform-specific intervals
-    blogger_enabled: bool = Field(default=True)
-    devto_enabled: bool = Field(default=True)
-    telegram_enabled: bool = Field(default=True)
-    facebook_enabled: bool = Field(default=True)
+    # Platform enable flags, packed as a bitmask (see _PLATFORM_BITS).
+    # `bool(enabled_platforms)` answers "is anything enabled?" in one test.
+    enabled_platforms: int = Field(default=0b1111, ge=0, le=0b1111)
+
+    blogger_enabled = _platform_flag(_PLATFORM_BITS["blogger"])
+    devto_enabled = _platform_flag(_PLATFORM_BITS["devto"])
+    telegram_enabled = _platform_flag(_PLATFORM_BITS["telegram"])
+    facebook_enabled = _platform_flag(_PLATFORM_BITS["facebook"])
+
+    @model_validator(mode="before")
+    @classmethod
+    def _pack_legacy_flags(cls, data: Any):
+        """Accept the old per-platform `<name>_enabled` booleans"""
+        if not isinstance(data, dict):
+            return data
+        if not any(f"{name}_enabled" in data for name in _PLATFORM_BITS):
+            return data
+        data = dict(data)
+        mask = data.get("enabled_platforms", 0b1111)
+        for name, bit in _PLATFORM_BITS.items():
+            if f"{name}_enabled" not in data:
+                continue
+            enabled = data.pop(f"{name}_enabled")
+            mask = mask | (1 << bit) if enabled else mask & ~(1 << bit)
+        data["enabled_platforms"] = mask
+        return data
 
 
 class PosterStyleConfig(BaseModel):
@@ -533,9 +711,33 @@ class AppConfig(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
-        json_schema_extra = {
-            "example": {
+        json_schema_extra = _schema_example(
+            lambda: {
                 "brand_name": "My Academy",
                 "telegram": {"bot_token": "xxx", "channel_id": "@myacademy"},
             }
-        }
+        )
+
+    @classmethod
+    def from_raw(cls, raw_bytes: bytes) -> "AppConfig":
+        """
+        Validate raw config JSON, reusing the result for unchanged content.
+
+        The cache is keyed by a hash of the raw bytes, so any edit to the
+        source produces a fresh instance. Callers always get their own deep
+        copy of the cached (never handed out) instance, so in-memory edits
+        don't leak into later loads of the same file.
+        """
+        key = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+        config = _CONFIG_CACHE.get(key)
+        if config is None:
+            config = cls.model_validate_json(raw_bytes)
+            if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+                # FIFO eviction (dicts keep insertion order)
+                del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+            _CONFIG_CACHE[key] = config
+        return config.model_copy(deep=True)
+
+
+_CONFIG_CACHE_SIZE = 4
+_CONFIG_CACHE: Dict[bytes, AppConfig] = {}
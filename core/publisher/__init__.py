@@ -1,8 +1,14 @@
 # Publisher Module - Handles all platform publishing
-from .blogger_publisher import BloggerPublisher
-from .devto_publisher import DevToPublisher
-from .telegram_publisher import TelegramPublisher
-from .facebook_publisher import FacebookPublisher
+# Submodules are imported lazily (PEP 562) so a process that only publishes
+# to one platform doesn't pay the import cost of the others.
+import importlib
+
+_LAZY = {
+    "BloggerPublisher": ".blogger_publisher",
+    "DevToPublisher": ".devto_publisher",
+    "TelegramPublisher": ".telegram_publisher",
+    "FacebookPublisher": ".facebook_publisher",
+}
 
 __all__ = [
     "BloggerPublisher",
@@ -10,3 +16,12 @@ __all__ = [
     "TelegramPublisher",
     "FacebookPublisher",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
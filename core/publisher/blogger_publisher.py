@@ -17,22 +17,112 @@ Usage:
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import json
+import os
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 import logging
+import time
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from core.config_manager import ConfigManager
+from core.publisher.http import (
+    PatchDigests,
+    error_body,
+    get_shared_client,
+    get_throttler,
+    idempotent_retry,
+    is_retryable_write,
+    read_json,
+    send_json,
+    with_retries,
+)
 
 logger = logging.getLogger(__name__)
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
 
 class BloggerAuthError(Exception):
     """Non-retriable authentication/config error for Blogger."""
 
 
+def _is_transient(exc: BaseException) -> bool:
+    """Retry a write only if nothing was created (incl. expired tokens)"""
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 401:
+        return True
+    return is_retryable_write(exc)
+
+
+class _TokenCache:
+    """
+    Access-token cache shared across processes via a small JSON file.
+
+    Entries are keyed by OAuth client_id and store `expires_at` as epoch
+    seconds. An asyncio.Lock serializes access within the process and an
+    flock (where available) coordinates with other workers; the file work
+    runs in a thread so waiting on another worker's flock doesn't block
+    the event loop.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = asyncio.Lock()
+
+    def _read_all(self, f) -> Dict[str, Any]:
+        f.seek(0)
+        raw = f.read()
+        try:
+            return json.loads(raw) if raw else {}
+        except ValueError:
+            return {}
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        f = os.fdopen(fd, "r+", encoding="utf-8")
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        return f
+
+    def _load(self, client_id: str) -> Optional[Dict[str, Any]]:
+        with self._open() as f:
+            return self._read_all(f).get(client_id)
+
+    def _store(self, client_id: str, token: str, expires_at: float):
+        with self._open() as f:
+            data = self._read_all(f)
+            data[client_id] = {"access_token": token, "expires_at": expires_at}
+            f.seek(0)
+            f.truncate()
+            json.dump(data, f)
+
+    async def get(self, client_id: str) -> Optional[Tuple[str, float]]:
+        """Return a cached (access_token, expires_at) that is still valid"""
+        async with self._lock:
+            try:
+                entry = await asyncio.to_thread(self._load, client_id)
+            except OSError as e:
+                logger.debug("Token cache read failed: %s", e)
+                return None
+
+        if not entry or entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry["access_token"], entry["expires_at"]
+
+    async def set(self, client_id: str, token: str, expires_at: float):
+        """Store a freshly refreshed token"""
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self._store, client_id, token, expires_at)
+            except OSError as e:
+                logger.debug("Token cache write failed: %s", e)
+
+
 class BloggerPublisher:
     """
     Blogger API Publisher
@@ -43,28 +133,63 @@ class BloggerPublisher:
     BLOGGER_API_URL = "https://www.googleapis.com/blogger/v3"
     TOKEN_URL = "https://oauth2.googleapis.com/token"
 
-    def __init__(self, config: ConfigManager):
+    def __init__(
+        self, config: ConfigManager, client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Blogger Publisher
 
         Args:
             config: ConfigManager instance
+            client: Optional HTTP client (defaults to the shared publisher client)
         """
         self.config = config
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client: Optional[httpx.AsyncClient] = client
         self._access_token: Optional[str] = None
-        self._token_expires: Optional[datetime] = None
+        self._token_expires: Optional[float] = None
+        # Last token the API rejected (401); never re-adopted from the file cache
+        self._rejected_token: Optional[str] = None
+        # Request headers for the current token, rebuilt only on refresh
+        self._auth_headers: Dict[str, str] = {}
+        self._json_headers: Dict[str, str] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._sent_patches = PatchDigests()
+        self._token_cache = _TokenCache(
+            Path(config.config_path).parent / ".blogger_token_cache.json"
+        )
+
+        # Settings derived from config, re-derived only when it is (re)loaded
+        self._config_snapshot = None
+        self._configured = False
+        self._blog_url = ""
+        self._posts_url = ""
+        self._sync_config()
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=60.0)
-        return self._http_client
+        """Get HTTP client (injected, or the shared pooled client)"""
+        return self._http_client or get_shared_client()
 
     async def close(self):
-        """Close HTTP client"""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
+        """Release resources (HTTP clients are shared/owned by the caller)"""
+        self._http_client = None
+
+    async def warmup(self):
+        """
+        Open connections to the Blogger API and token hosts ahead of time
+
+        Pays DNS + TCP + TLS at startup instead of on the first publish; the
+        connections then sit in the shared client's keep-alive pool.
+        """
+        client = await self._get_client()
+        results = await asyncio.gather(
+            client.head(self.BLOGGER_API_URL, timeout=5.0),
+            client.head(self.TOKEN_URL, timeout=5.0),
+            return_exceptions=True,
+        )
+        for result in results:
+            # Any status is fine, only the connection matters
+            if isinstance(result, Exception):
+                logger.debug("Blogger warmup failed: %s", result)
 
     @property
     def blogger_config(self):
@@ -73,7 +198,24 @@ class BloggerPublisher:
 
     def is_configured(self) -> bool:
         """Check if Blogger is properly configured"""
-        return self.config.is_configured("blogger")
+        self._sync_config()
+        return self._configured
+
+    def _sync_config(self):
+        """Refresh cached settings if the AppConfig instance changed (reload)"""
+        app_config = self.config.app_config
+        if app_config is self._config_snapshot:
+            return
+
+        blogger = app_config.blogger
+        blog_id = blogger.blog_id if blogger else ""
+        self._config_snapshot = app_config
+        self._configured = self.config.is_configured("blogger")
+        self._blog_url = f"{self.BLOGGER_API_URL}/blogs/{blog_id}"
+        self._posts_url = f"{self._blog_url}/posts"
+        self._limiter = get_throttler(
+            "blogger", rate_limit=blogger.rate_limit if blogger else 1, period=1.0
+        )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # OAUTH2 AUTHENTICATION
@@ -102,24 +244,27 @@ class BloggerPublisher:
             response = await client.post(self.TOKEN_URL, data=payload)
             response.raise_for_status()
 
-            data = response.json()
-            self._access_token = data["access_token"]
+            data = read_json(response)
 
             # Token typically expires in 3600 seconds
             expires_in = data.get("expires_in", 3600)
-            self._token_expires = (
-                datetime.utcnow().timestamp() + expires_in - 60
-            )  # 1 min buffer
+            ttl = expires_in - 60  # 1 min buffer
+            self._set_token(data["access_token"], ttl)
+
+            # The shared cache is read by other processes, so it stores wall-clock time
+            await self._token_cache.set(
+                self.blogger_config.client_id, self._access_token, time.time() + ttl
+            )
 
             logger.info("✅ Blogger access token refreshed")
             return self._access_token
 
         except httpx.HTTPStatusError as e:
-            body = e.response.text
+            body = error_body(e.response)
             # Common permanent failure: refresh token revoked/expired.
             if e.response.status_code == 400:
                 try:
-                    data = e.response.json()
+                    data = read_json(e.response)
                 except Exception:
                     data = {}
                 if data.get("error") == "invalid_grant":
@@ -128,25 +273,53 @@ class BloggerPublisher:
                     )
                     raise BloggerAuthError("invalid_grant")
 
-            logger.error(f"Token refresh failed: {body}")
+            logger.error("Token refresh failed: %s", body)
             raise
 
     async def _get_access_token(self) -> str:
         """Get valid access token, refreshing if needed"""
-        now = datetime.utcnow().timestamp()
-
-        if self._access_token and self._token_expires and now < self._token_expires:
+        if self._token_valid():
             return self._access_token
 
-        return await self._refresh_access_token()
+        # Only one coroutine refreshes; the rest wait and reuse its token
+        async with self._refresh_lock:
+            if self._token_valid():
+                return self._access_token
+
+            # Another worker may have refreshed recently (unless it cached the
+            # very token that was just rejected: then a real refresh is needed)
+            cached = await self._token_cache.get(self.blogger_config.client_id)
+            if cached and cached[0] != self._rejected_token:
+                token, expires_at = cached
+                self._set_token(token, expires_at - time.time())
+                return self._access_token
+
+            return await self._refresh_access_token()
+
+    def _invalidate_token(self):
+        """Drop the current token after a 401 so the next call refreshes it"""
+        self._rejected_token = self._access_token or self._rejected_token
+        self._access_token = None
+
+    def _set_token(self, token: str, ttl: float):
+        """Adopt a new access token valid for `ttl` seconds"""
+        self._access_token = token
+        self._token_expires = time.monotonic() + ttl
+        self._auth_headers = {"Authorization": f"Bearer {token}"}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
+
+    def _token_valid(self) -> bool:
+        """Check if the in-memory access token is still usable"""
+        return bool(
+            self._access_token
+            and self._token_expires
+            and time.monotonic() < self._token_expires
+        )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PUBLISHING
     # ═══════════════════════════════════════════════════════════════════════════
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=30)
-    )
     async def publish(
         self,
         title: str,
@@ -166,12 +339,25 @@ class BloggerPublisher:
         Returns:
             Published article URL, or None if failed
         """
+        return await with_retries(
+            lambda: self._publish_once(title, content, labels, is_draft),
+            _is_transient,
+        )
+
+    async def _publish_once(
+        self,
+        title: str,
+        content: str,
+        labels: Optional[List[str]],
+        is_draft: bool,
+    ) -> Optional[str]:
+        """Single publish attempt; raises only for retriable failures"""
         if not self.is_configured():
             logger.error("Blogger not configured")
             return None
 
         try:
-            access_token = await self._get_access_token()
+            await self._get_access_token()
         except BloggerAuthError:
             # Permanent auth issue: don't retry; surface as a clean failure.
             return None
@@ -183,49 +369,51 @@ class BloggerPublisher:
         if labels:
             post_data["labels"] = labels
 
-        # API endpoint
-        blog_id = self.blogger_config.blog_id
-        url = f"{self.BLOGGER_API_URL}/blogs/{blog_id}/posts"
+        url = self._posts_url
 
         params = {}
         if is_draft:
             params["isDraft"] = "true"
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
         try:
-            response = await client.post(
-                url, json=post_data, headers=headers, params=params
-            )
+            async with self._limiter:
+                response = await send_json(
+                    client,
+                    "POST",
+                    url,
+                    post_data,
+                    headers=self._json_headers,
+                    params=params,
+                )
             response.raise_for_status()
 
-            data = response.json()
+            data = read_json(response)
             post_url = data.get("url")
             post_id = data.get("id")
 
-            logger.info(f"✅ Published to Blogger: {post_url}")
+            logger.info("✅ Published to Blogger: %s", post_url)
             return post_url
 
         except httpx.HTTPStatusError as e:
-            error_detail = e.response.text
+            error_detail = error_body(e.response)
             logger.error(
-                f"Blogger publish failed: {e.response.status_code} - {error_detail}"
+                "Blogger publish failed: %d - %s", e.response.status_code, error_detail
             )
 
             # Handle specific errors
             if e.response.status_code == 401:
                 # Token might be invalid, clear it
-                self._access_token = None
+                self._invalidate_token()
                 raise
             elif e.response.status_code == 403:
                 logger.error("Permission denied. Check API access.")
+            elif _is_transient(e):
+                # Server-side / rate-limit failure: let with_retries retry
+                raise
 
             return None
         except Exception as e:
-            logger.error(f"Blogger publish error: {e}")
+            logger.error("Blogger publish error: %s", e)
             return None
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -242,19 +430,8 @@ class BloggerPublisher:
         if not self.is_configured():
             return None
 
-        access_token = await self._get_access_token()
-        client = await self._get_client()
-
-        blog_id = self.blogger_config.blog_id
-        url = f"{self.BLOGGER_API_URL}/blogs/{blog_id}"
-
-        headers = {"Authorization": f"Bearer {access_token}"}
-
         try:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-
-            data = response.json()
+            data = await self._api_get(self._blog_url)
             return {
                 "id": data.get("id"),
                 "name": data.get("name"),
@@ -263,7 +440,7 @@ class BloggerPublisher:
                 "published": data.get("published"),
             }
         except Exception as e:
-            logger.error(f"Failed to get blog info: {e}")
+            logger.error("Failed to get blog info: %s", e)
             return None
 
     async def get_recent_posts(self, max_results: int = 10) -> List[Dict[str, Any]]:
@@ -279,37 +456,108 @@ class BloggerPublisher:
         if not self.is_configured():
             return []
 
-        access_token = await self._get_access_token()
-        client = await self._get_client()
+        try:
+            data = await self._api_get(
+                self._posts_url, params={"maxResults": max_results}
+            )
+            return [self._post_info(item) for item in data.get("items", [])]
+        except Exception as e:
+            logger.error("Failed to get posts: %s", e)
+            return []
 
-        blog_id = self.blogger_config.blog_id
-        url = f"{self.BLOGGER_API_URL}/blogs/{blog_id}/posts"
+    async def get_snapshot(self, max_posts: int = 10) -> Dict[str, Any]:
+        """
+        Get blog info and recent posts in one go (requests run concurrently)
 
-        headers = {"Authorization": f"Bearer {access_token}"}
-        params = {"maxResults": max_results}
+        Args:
+            max_posts: Maximum number of recent posts
 
-        try:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()
+        Returns:
+            {"info": blog info dict or None, "posts": list of post info dicts}
+        """
+        info, posts = await asyncio.gather(
+            self.get_blog_info(),
+            self.get_recent_posts(max_posts),
+            return_exceptions=True,
+        )
+        return {
+            "info": None if isinstance(info, Exception) else info,
+            "posts": [] if isinstance(posts, Exception) else posts,
+        }
 
-            data = response.json()
-            posts = []
-
-            for item in data.get("items", []):
-                posts.append(
-                    {
-                        "id": item.get("id"),
-                        "title": item.get("title"),
-                        "url": item.get("url"),
-                        "published": item.get("published"),
-                        "labels": item.get("labels", []),
-                    }
-                )
+    async def iter_all_posts(
+        self, per_page: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every post in the blog, page by page
+
+        Blogger pages are chained by `nextPageToken`, so pages can't be
+        requested in parallel; instead the next page is prefetched while
+        the current one is being consumed.
+
+        Args:
+            per_page: Posts per request (Blogger caps this at 500)
 
-            return posts
+        Yields:
+            Post info dicts, newest first
+        """
+        if not self.is_configured():
+            return
+
+        next_page = asyncio.ensure_future(self._fetch_posts_page(None, per_page))
+        try:
+            while next_page is not None:
+                data = await next_page
+                token = data.get("nextPageToken")
+                next_page = (
+                    asyncio.ensure_future(self._fetch_posts_page(token, per_page))
+                    if token
+                    else None
+                )
+                for item in data.get("items", []):
+                    yield self._post_info(item)
         except Exception as e:
-            logger.error(f"Failed to get posts: {e}")
-            return []
+            logger.error("Failed to iterate posts: %s", e)
+        finally:
+            if next_page is not None:
+                # Also retrieves a prefetch that already failed, so its error
+                # isn't reported as "never retrieved"
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
+
+    async def _fetch_posts_page(
+        self, page_token: Optional[str], per_page: int
+    ) -> Dict[str, Any]:
+        """Fetch one raw page of `GET /blogs/{id}/posts`"""
+        params = {"maxResults": per_page, "fetchBodies": "false"}
+        if page_token:
+            params["pageToken"] = page_token
+
+        return await self._api_get(self._posts_url, params=params)
+
+    @idempotent_retry
+    async def _api_get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Throttled, retried `GET` against the Blogger API; returns parsed JSON"""
+        await self._get_access_token()
+        client = await self._get_client()
+
+        async with self._limiter:
+            response = await client.get(url, headers=self._auth_headers, params=params)
+        response.raise_for_status()
+        return read_json(response)
+
+    @staticmethod
+    def _post_info(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a Blogger post resource to the fields we use"""
+        return {
+            "id": item.get("id"),
+            "title": item.get("title"),
+            "url": item.get("url"),
+            "published": item.get("published"),
+            "labels": item.get("labels", []),
+        }
 
     # ═══════════════════════════════════════════════════════════════════════════
     # POST MANAGEMENT
@@ -337,17 +585,6 @@ class BloggerPublisher:
         if not self.is_configured():
             return False
 
-        access_token = await self._get_access_token()
-        client = await self._get_client()
-
-        blog_id = self.blogger_config.blog_id
-        url = f"{self.BLOGGER_API_URL}/blogs/{blog_id}/posts/{post_id}"
-
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
         post_data = {}
         if title:
             post_data["title"] = title
@@ -359,15 +596,38 @@ class BloggerPublisher:
         if not post_data:
             return True  # Nothing to update
 
+        digest = self._sent_patches.digest(post_data)
+        if self._sent_patches.matches(post_id, digest):
+            return True  # Same patch already applied
+
+        await self._get_access_token()
+        client = await self._get_client()
+
+        url = f"{self._posts_url}/{post_id}"
+
         try:
-            response = await client.patch(url, json=post_data, headers=headers)
-            response.raise_for_status()
-            logger.info(f"✅ Updated Blogger post: {post_id}")
+            async with self._limiter:
+                response = await send_json(
+                    client, "PATCH", url, post_data, headers=self._json_headers
+                )
+            if response.status_code >= 400:
+                self._log_failure("update post", response)
+                return False
+            self._sent_patches.remember(post_id, digest)
+            logger.info("✅ Updated Blogger post: %s", post_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to update post: {e}")
+            logger.error("Failed to update post: %s", e)
             return False
 
+    def _log_failure(self, action: str, response: httpx.Response):
+        """Log a non-retried API failure without raising"""
+        if response.status_code == 401:
+            self._invalidate_token()  # Force a refresh on the next call
+        logger.error(
+            "Failed to %s: %d - %s", action, response.status_code, error_body(response)
+        )
+
     async def delete_post(self, post_id: str) -> bool:
         """
         Delete a post
@@ -381,19 +641,20 @@ class BloggerPublisher:
         if not self.is_configured():
             return False
 
-        access_token = await self._get_access_token()
+        await self._get_access_token()
         client = await self._get_client()
 
-        blog_id = self.blogger_config.blog_id
-        url = f"{self.BLOGGER_API_URL}/blogs/{blog_id}/posts/{post_id}"
-
-        headers = {"Authorization": f"Bearer {access_token}"}
+        url = f"{self._posts_url}/{post_id}"
 
         try:
-            response = await client.delete(url, headers=headers)
-            response.raise_for_status()
-            logger.info(f"✅ Deleted Blogger post: {post_id}")
+            async with self._limiter:
+                response = await client.delete(url, headers=self._auth_headers)
+            if response.status_code >= 400:
+                self._log_failure("delete post", response)
+                return False
+            self._sent_patches.forget(post_id)
+            logger.info("✅ Deleted Blogger post: %s", post_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete post: {e}")
+            logger.error("Failed to delete post: %s", e)
             return False
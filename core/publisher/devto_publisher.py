@@ -16,19 +16,89 @@ Usage:
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import datetime
 import logging
 import re
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
 
 from core.config_manager import ConfigManager
+from core.publisher.http import (
+    PatchDigests,
+    error_body,
+    get_shared_client,
+    get_throttler,
+    idempotent_retry,
+    is_retryable_write,
+    read_json,
+    send_json,
+    with_retries,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _TagTable(dict):
+    """str.translate table that deletes every character not mapped explicitly"""
+
+    def __missing__(self, codepoint):
+        return None
+
+
+# Applied after str.lower(), which also folds non-ASCII letters like
+# "\u212a" (Kelvin sign) to ASCII ones the table keeps
+_TAG_TABLE = _TagTable({ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789-"})
+_TAG_TABLE[ord(" ")] = "-"
+
+# Precompiled patterns for tag cleaning / markdown formatting
+_MULTI_HYPHEN = re.compile(r"-+")
+_HTML_TAG = re.compile(r"<[^>]+>")
+# Literal-led patterns with constant replacements: the regex engine can skip
+# ahead to candidate positions and sub() needs no group template expansion
+_CODE_FENCE = re.compile(r"```(?=\w*\n)")
+_HEADER_BREAK = re.compile(r"\n(?<=[^\n]\n)(?=#{1,3} )")
+
+# Keywords that mark a topic as tech-related (suitable for Dev.to)
+_TECH_KEYWORDS = (
+    "programming",
+    "code",
+    "coding",
+    "developer",
+    "development",
+    "software",
+    "api",
+    "database",
+    "python",
+    "javascript",
+    "react",
+    "node",
+    "web",
+    "app",
+    "mobile",
+    "cloud",
+    "devops",
+    "ai",
+    "machine learning",
+    "data",
+    "algorithm",
+    "github",
+    "git",
+    "docker",
+    "kubernetes",
+    "linux",
+    "برمجة",
+    "كود",
+    "تطوير",
+    "مطور",
+    "تقنية",
+    "ذكاء اصطناعي",
+)
+# One alternation scanned in a single pass by the regex engine
+_TECH_RE = re.compile("|".join(map(re.escape, _TECH_KEYWORDS)), re.IGNORECASE)
+
+
 class DevToPublisher:
     """
     Dev.to API Publisher
@@ -38,32 +108,47 @@ class DevToPublisher:
 
     DEVTO_API_URL = "https://dev.to/api"
 
-    def __init__(self, config: ConfigManager):
+    def __init__(
+        self, config: ConfigManager, client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Dev.to Publisher
 
         Args:
             config: ConfigManager instance
+            client: Optional HTTP client (defaults to the shared publisher client)
         """
         self.config = config
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client: Optional[httpx.AsyncClient] = client
+        self._sent_patches = PatchDigests()
+
+        # Settings derived from config, re-derived only when it is (re)loaded
+        self._config_snapshot = None
+        self._configured = False
+        self._org_fields: Dict[str, int] = {}
+        self._auth_headers: Dict[str, str] = {}
+        self._sync_config()
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
-                timeout=60.0,
-                headers={
-                    "api-key": self.config.app_config.devto.api_key,
-                    "Content-Type": "application/json",
-                },
-            )
-        return self._http_client
+        """Get HTTP client (injected, or the shared pooled client)"""
+        return self._http_client or get_shared_client()
 
     async def close(self):
-        """Close HTTP client"""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
+        """Release resources (HTTP clients are shared/owned by the caller)"""
+        self._http_client = None
+
+    def _headers(self) -> Dict[str, str]:
+        """Per-request auth headers (the shared client carries none)"""
+        return self._auth_headers
+
+    async def warmup(self):
+        """Open a connection to the Dev.to API ahead of the first publish"""
+        client = await self._get_client()
+        try:
+            # Any status is fine, only the connection matters
+            await client.head(self.DEVTO_API_URL, timeout=5.0)
+        except Exception as e:
+            logger.debug("Dev.to warmup failed: %s", e)
 
     @property
     def devto_config(self):
@@ -72,15 +157,38 @@ class DevToPublisher:
 
     def is_configured(self) -> bool:
         """Check if Dev.to is properly configured"""
-        return self.config.is_configured("devto")
+        self._sync_config()
+        return self._configured
+
+    def _sync_config(self):
+        """Refresh cached settings if the AppConfig instance changed (reload)"""
+        app_config = self.config.app_config
+        if app_config is self._config_snapshot:
+            return
+
+        devto = app_config.devto
+        self._config_snapshot = app_config
+        self._configured = self.config.is_configured("devto")
+        self._org_fields = {}
+        if devto and devto.organization_id:
+            try:
+                self._org_fields = {"organization_id": int(devto.organization_id)}
+            except ValueError:
+                logger.warning(
+                    "Ignoring invalid Dev.to organization_id: %s", devto.organization_id
+                )
+        self._auth_headers = {
+            "api-key": devto.api_key if devto else "",
+            "Content-Type": "application/json",
+        }
+        self._limiter = get_throttler(
+            "devto", rate_limit=devto.rate_limit if devto else 10, period=30.0
+        )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PUBLISHING
     # ═══════════════════════════════════════════════════════════════════════════
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=30)
-    )
     async def publish(
         self,
         title: str,
@@ -109,63 +217,126 @@ class DevToPublisher:
             logger.error("Dev.to not configured")
             return None
 
-        client = await self._get_client()
+        return await self._publish_one(
+            self._build_payload(
+                title,
+                content,
+                tags=tags,
+                series=series,
+                canonical_url=canonical_url,
+                cover_image=cover_image,
+                is_published=is_published,
+            )
+        )
+
+    async def publish_many(
+        self, items: List[Dict[str, Any]], max_at_once: int = 8
+    ) -> List[Optional[str]]:
+        """
+        Publish several articles concurrently
+
+        Requests overlap up to `max_at_once` in flight; the per-host
+        rate limiter still caps how fast they are sent.
+
+        Args:
+            items: List of `publish()` keyword-argument dicts
+            max_at_once: Maximum concurrent requests
+
+        Returns:
+            Article URLs (or None for failures), in the same order as `items`
+        """
+        if not self.is_configured():
+            logger.error("Dev.to not configured")
+            return [None] * len(items)
+
+        payloads = [self._build_payload(**item) for item in items]
+        semaphore = asyncio.Semaphore(max_at_once)
 
+        async def _bounded(payload: bytes) -> Optional[str]:
+            async with semaphore:
+                return await self._publish_one(payload)
+
+        results = await asyncio.gather(
+            *(_bounded(payload) for payload in payloads), return_exceptions=True
+        )
+        return [None if isinstance(r, BaseException) else r for r in results]
+
+    def _build_payload(
+        self,
+        title: str,
+        content: str,
+        tags: Optional[List[str]] = None,
+        series: Optional[str] = None,
+        canonical_url: Optional[str] = None,
+        cover_image: Optional[str] = None,
+        is_published: bool = True,
+    ) -> bytes:
+        """Build the serialized `POST /articles` request body"""
         # Clean and validate tags
         if tags:
             tags = [self._clean_tag(tag) for tag in tags[:4]]
 
-        # Build article data
-        article_data = {
-            "article": {
-                "title": title,
-                "body_markdown": content,
-                "published": is_published,
-                "tags": tags or [],
-            }
+        # Build article data (organization fields are fixed per config)
+        article = {
+            "title": title,
+            "body_markdown": content,
+            "published": is_published,
+            "tags": tags or [],
+            **self._org_fields,
         }
 
         if cover_image:
-            article_data["article"]["cover_image"] = cover_image
+            article["cover_image"] = cover_image
 
         if series:
-            article_data["article"]["series"] = series
+            article["series"] = series
 
         if canonical_url:
-            article_data["article"]["canonical_url"] = canonical_url
+            article["canonical_url"] = canonical_url
 
-        if self.devto_config.organization_id:
-            article_data["article"]["organization_id"] = int(
-                self.devto_config.organization_id
-            )
+        # Serialized once, so retries resend the same bytes
+        return orjson.dumps({"article": article})
+
+    async def _publish_one(self, body: bytes) -> Optional[str]:
+        """POST a prepared article body; returns the article URL or None"""
+        return await with_retries(lambda: self._post_article(body), is_retryable_write)
 
+    async def _post_article(self, body: bytes) -> Optional[str]:
+        """Single publish attempt; raises only for retriable failures"""
+        client = await self._get_client()
         url = f"{self.DEVTO_API_URL}/articles"
 
         try:
-            response = await client.post(url, json=article_data)
+            async with self._limiter:
+                response = await send_json(
+                    client, "POST", url, body, headers=self._headers()
+                )
             response.raise_for_status()
 
-            data = response.json()
+            data = read_json(response)
             article_url = data.get("url")
             article_id = data.get("id")
 
-            logger.info(f"✅ Published to Dev.to: {article_url}")
+            logger.info("✅ Published to Dev.to: %s", article_url)
             return article_url
 
         except httpx.HTTPStatusError as e:
-            error_detail = e.response.text
+            error_detail = error_body(e.response)
             logger.error(
-                f"Dev.to publish failed: {e.response.status_code} - {error_detail}"
+                "Dev.to publish failed: %d - %s", e.response.status_code, error_detail
             )
 
             if e.response.status_code == 401:
                 logger.error("Invalid API key")
             elif e.response.status_code == 422:
-                logger.error(f"Validation error: {error_detail}")
+                logger.error("Validation error: %s", error_detail)
+            elif is_retryable_write(e):
+                # Server-side / rate-limit failure: let with_retries retry
+                raise
 
             return None
         except Exception as e:
-            logger.error(f"Dev.to publish error: {e}")
+            logger.error("Dev.to publish error: %s", e)
             return None
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -182,14 +353,8 @@ class DevToPublisher:
         if not self.is_configured():
             return None
 
-        client = await self._get_client()
-        url = f"{self.DEVTO_API_URL}/users/me"
-
         try:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            data = response.json()
+            data = await self._api_get("/users/me")
             return {
                 "id": data.get("id"),
                 "username": data.get("username"),
@@ -199,7 +364,7 @@ class DevToPublisher:
                 "github_username": data.get("github_username"),
             }
         except Exception as e:
-            logger.error(f"Failed to get user info: {e}")
+            logger.error("Failed to get user info: %s", e)
             return None
 
     async def get_my_articles(
@@ -219,36 +384,130 @@ class DevToPublisher:
         if not self.is_configured():
             return []
 
-        client = await self._get_client()
-        url = f"{self.DEVTO_API_URL}/articles/me"
-
         params = {"page": page, "per_page": min(per_page, 1000), "state": state}
 
         try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+            items = await self._api_get("/articles/me", params=params)
+            return [self._article_info(item) for item in items]
+        except Exception as e:
+            logger.error("Failed to get articles: %s", e)
+            return []
 
-            articles = []
-            for item in response.json():
-                articles.append(
-                    {
-                        "id": item.get("id"),
-                        "title": item.get("title"),
-                        "url": item.get("url"),
-                        "published_at": item.get("published_at"),
-                        "positive_reactions_count": item.get(
-                            "positive_reactions_count"
-                        ),
-                        "comments_count": item.get("comments_count"),
-                        "page_views_count": item.get("page_views_count"),
-                        "tags": item.get("tag_list", []),
-                    }
-                )
+    async def get_snapshot(self, max_articles: int = 10) -> Dict[str, Any]:
+        """
+        Get user info and recent articles in one go (requests run concurrently)
+
+        Args:
+            max_articles: Maximum number of articles
+
+        Returns:
+            {"info": user info dict or None, "articles": list of article dicts}
+        """
+        info, articles = await asyncio.gather(
+            self.get_user_info(),
+            self.get_my_articles(per_page=max_articles),
+            return_exceptions=True,
+        )
+        return {
+            "info": None if isinstance(info, Exception) else info,
+            "articles": [] if isinstance(articles, Exception) else articles,
+        }
+
+    async def iter_my_articles(
+        self, per_page: int = 100, state: str = "all", concurrency: int = 8
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all of the user's articles, fetching pages concurrently
+
+        Up to `concurrency` pages are in flight at once and each is yielded
+        as it arrives. A short page marks the end: no further pages are
+        scheduled and in-flight ones past it are cancelled. Order is not
+        guaranteed. Pending requests are cancelled if a page fails or the
+        consumer stops early.
+
+        Args:
+            per_page: Articles per page (max 1000)
+            state: Filter by state (all, published, unpublished)
+            concurrency: Pages in flight at once
 
-            return articles
+        Yields:
+            Article info dicts
+        """
+        if not self.is_configured():
+            return
+
+        per_page = min(per_page, 1000)
+        pending: Dict[asyncio.Task, int] = {}
+        next_page = 1
+        last_page: Optional[int] = None
+        try:
+            while True:
+                while last_page is None and len(pending) < concurrency:
+                    task = asyncio.create_task(
+                        self._fetch_articles_page(next_page, per_page, state)
+                    )
+                    pending[task] = next_page
+                    next_page += 1
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    page = pending.pop(task)
+                    if task.cancelled():
+                        continue
+                    items = task.result()
+                    if last_page is not None and page > last_page:
+                        continue  # Past the end (finished before being cancelled)
+                    if len(items) < per_page:
+                        last_page = page
+                        for other, other_page in pending.items():
+                            if other_page > last_page:
+                                other.cancel()
+                    for item in items:
+                        yield self._article_info(item)
         except Exception as e:
-            logger.error(f"Failed to get articles: {e}")
-            return []
+            logger.error("Failed to iterate articles: %s", e)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _fetch_articles_page(
+        self, page: int, per_page: int, state: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch one raw page of `GET /articles/me/{state}`"""
+        return await self._api_get(
+            f"/articles/me/{state}", params={"page": page, "per_page": per_page}
+        )
+
+    @idempotent_retry
+    async def _api_get(self, path: str, params: Optional[Dict[str, Any]] = None):
+        """Throttled, retried `GET` against the Dev.to API; returns parsed JSON"""
+        client = await self._get_client()
+
+        async with self._limiter:
+            response = await client.get(
+                f"{self.DEVTO_API_URL}{path}", params=params, headers=self._headers()
+            )
+        response.raise_for_status()
+        return read_json(response)
+
+    @staticmethod
+    def _article_info(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a Dev.to article resource to the fields we use"""
+        return {
+            "id": item.get("id"),
+            "title": item.get("title"),
+            "url": item.get("url"),
+            "published_at": item.get("published_at"),
+            "positive_reactions_count": item.get("positive_reactions_count"),
+            "comments_count": item.get("comments_count"),
+            "page_views_count": item.get("page_views_count"),
+            "tags": item.get("tag_list", []),
+        }
 
     # ═══════════════════════════════════════════════════════════════════════════
     # ARTICLE MANAGEMENT
@@ -278,9 +537,6 @@ class DevToPublisher:
         if not self.is_configured():
             return False
 
-        client = await self._get_client()
-        url = f"{self.DEVTO_API_URL}/articles/{article_id}"
-
         article_data = {"article": {}}
 
         if title:
@@ -295,13 +551,30 @@ class DevToPublisher:
         if not article_data["article"]:
             return True  # Nothing to update
 
+        digest = self._sent_patches.digest(article_data)
+        if self._sent_patches.matches(article_id, digest):
+            return True  # Same update already applied
+
+        client = await self._get_client()
+        url = f"{self.DEVTO_API_URL}/articles/{article_id}"
+
         try:
-            response = await client.put(url, json=article_data)
-            response.raise_for_status()
-            logger.info(f"✅ Updated Dev.to article: {article_id}")
+            async with self._limiter:
+                response = await send_json(
+                    client, "PUT", url, article_data, headers=self._headers()
+                )
+            if response.status_code >= 400:
+                logger.error(
+                    "Failed to update article: %d - %s",
+                    response.status_code,
+                    error_body(response),
+                )
+                return False
+            self._sent_patches.remember(article_id, digest)
+            logger.info("✅ Updated Dev.to article: %s", article_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to update article: {e}")
+            logger.error("Failed to update article: %s", e)
             return False
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -318,10 +591,9 @@ class DevToPublisher:
         - Only letters, numbers, hyphens
         - Max 20 characters
         """
-        tag = tag.lower().strip()
-        tag = re.sub(r"[^a-z0-9\-]", "", tag.replace(" ", "-"))
-        tag = re.sub(r"-+", "-", tag)  # Remove multiple hyphens
-        return tag[:20]
+        # One translate pass hyphenates and filters
+        tag = tag.strip().lower().translate(_TAG_TABLE)
+        return _MULTI_HYPHEN.sub("-", tag)[:20]  # Remove multiple hyphens
 
     def is_tech_topic(self, topic: str) -> bool:
         """
@@ -333,43 +605,7 @@ class DevToPublisher:
         Returns:
             True if tech-related
         """
-        tech_keywords = [
-            "programming",
-            "code",
-            "coding",
-            "developer",
-            "development",
-            "software",
-            "api",
-            "database",
-            "python",
-            "javascript",
-            "react",
-            "node",
-            "web",
-            "app",
-            "mobile",
-            "cloud",
-            "devops",
-            "ai",
-            "machine learning",
-            "data",
-            "algorithm",
-            "github",
-            "git",
-            "docker",
-            "kubernetes",
-            "linux",
-            "برمجة",
-            "كود",
-            "تطوير",
-            "مطور",
-            "تقنية",
-            "ذكاء اصطناعي",
-        ]
-
-        topic_lower = topic.lower()
-        return any(keyword in topic_lower for keyword in tech_keywords)
+        return _TECH_RE.search(topic) is not None
 
     def format_markdown(self, content: str) -> str:
         """
@@ -382,12 +618,13 @@ class DevToPublisher:
             Cleaned markdown
         """
         # Remove any HTML if present
-        content = re.sub(r"<[^>]+>", "", content)
+        if "<" in content:
+            content = _HTML_TAG.sub("", content)
 
         # Ensure proper code block formatting
-        content = re.sub(r"```(\w+)?\n", r"\n```\1\n", content)
+        content = _CODE_FENCE.sub("\n```", content)
 
         # Add line breaks before headers
-        content = re.sub(r"([^\n])(\n#{1,3} )", r"\1\n\2", content)
+        content = _HEADER_BREAK.sub("\n\n", content)
 
         return content.strip()
@@ -17,18 +17,189 @@ Usage:
 """
 
 import asyncio
-from typing import Optional, Dict, Any, List
+from contextlib import aclosing
+from typing import Optional, Dict, Any, List, Tuple, Union, AsyncIterator
 from datetime import datetime
 import logging
-import json
+import re
+import time
+from urllib.parse import quote, urlencode
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
 
 from core.config_manager import ConfigManager
+from core.publisher.http import (
+    get_shared_client,
+    get_throttler,
+    idempotent_retry,
+    is_retryable_write,
+    read_json,
+    with_retries,
+)
 
 logger = logging.getLogger(__name__)
 
+# Graph API quota headers: percent of quota used over a rolling hour
+_USAGE_HEADERS = ("x-app-usage", "x-page-usage", "x-business-use-case-usage")
+_USAGE_SOFT_LIMIT = 90
+# Longest hold-off slept through inside a call; longer pauses fail fast instead
+_USAGE_PAUSE_CAP = 300.0
+
+# Graph API error codes meaning "throttled", worth retrying after a wait
+_RATE_LIMIT_CODES = frozenset({4, 17, 32, 613})
+# Deterministic failures (invalid token, missing permission): never retried
+_PERMANENT_CODES = frozenset({190, 200})
+_ERROR_HINTS = {
+    190: "access token expired or invalid",
+    200: "permission denied, check Page access",
+    **{code: "rate limited" for code in _RATE_LIMIT_CODES},
+}
+# Transport failures raised before the request reached Facebook, safe to resend
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Photo URLs Facebook can fetch (it only takes public http(s) URLs)
+_PHOTO_URL = re.compile(r'https?://[^\s<>"]+')
+
+# page_id -> monotonic time until which calls hold off (high quota usage)
+_pause_until: Dict[str, float] = {}
+
+# Circuit breaker: after this many invalid-token (190) responses in a row,
+# calls with that token fail fast until the cooldown ends or the token verifies
+_AUTH_FAILURE_LIMIT = 3
+_AUTH_COOLDOWN = 300.0
+# Keyed by access token, so a replaced token starts with a closed breaker.
+# token -> consecutive invalid-token responses
+_auth_failures: Dict[str, int] = {}
+# token -> monotonic time until which calls are refused without a request
+_auth_open_until: Dict[str, float] = {}
+
+
+class FacebookAuthError(Exception):
+    """Call refused locally: the Page token was rejected repeatedly."""
+
+
+class FacebookThrottledError(Exception):
+    """Call refused locally: the Page is paused for longer than we wait inline."""
+
+
+def _error(response: httpx.Response) -> Dict[str, Any]:
+    """Graph API `error` object from an error response body ({} if none)"""
+    try:
+        return read_json(response).get("error") or {}
+    except Exception:
+        return {}
+
+
+def _error_code(response: httpx.Response) -> Optional[int]:
+    """Graph API error code from an error response body, if any"""
+    return _error(response).get("code")
+
+
+def _describe_error(exc: BaseException) -> str:
+    """One log line for a failed Graph call, spelling out the known error codes"""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return str(exc) or type(exc).__name__
+
+    error = _error(exc.response)
+    message = error.get("message") or f"HTTP {exc.response.status_code}"
+    hint = _ERROR_HINTS.get(error.get("code"))
+    return f"{message} ({hint})" if hint else message
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Retry throttling, server-side and connect failures, never 4xx client errors"""
+    if isinstance(exc, _UNSENT_ERRORS):
+        return True
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    code = _error_code(exc.response)
+    if code in _PERMANENT_CODES:
+        return False
+    return code in _RATE_LIMIT_CODES or is_retryable_write(exc)
+
+
+def _not_applied(exc: BaseException) -> bool:
+    """The call can't have taken effect: refused locally, unsent or rejected whole"""
+    if isinstance(exc, (FacebookAuthError, FacebookThrottledError, *_UNSENT_ERRORS)):
+        return True
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    # A 4xx on the request itself means Graph refused it before running it
+    return is_retryable_write(exc) or exc.response.is_client_error
+
+
+def _usage_pause(headers: httpx.Headers) -> float:
+    """Seconds to hold off given the quota usage headers (0 if comfortably under)"""
+    try:
+        usage, regain = _usage_levels(headers)
+    except (AttributeError, TypeError, ValueError):
+        # Runs after the call already succeeded: a malformed header must not
+        # turn a created post into a reported failure
+        return 0.0
+
+    if regain:
+        return float(regain)
+    if usage < _USAGE_SOFT_LIMIT:
+        return 0.0
+    # Back off harder the closer we are to the quota: 30s at 90%, 5min at 99%+
+    return min(_USAGE_PAUSE_CAP, 30.0 * (usage - _USAGE_SOFT_LIMIT + 1))
+
+
+def _usage_levels(headers: httpx.Headers) -> Tuple[float, float]:
+    """Highest usage percent and regain-access wait (seconds) across the headers"""
+    usage = 0.0
+    regain = 0.0
+    for name in _USAGE_HEADERS:
+        raw = headers.get(name)
+        if not raw:
+            continue
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            continue
+        if not isinstance(data, dict):
+            continue
+
+        if name == "x-business-use-case-usage":
+            # {"<business id>": [{"type": ..., "call_count": ..., ...}, ...]}
+            entries = [
+                e for group in data.values() if isinstance(group, list) for e in group
+            ]
+        else:
+            entries = [data]
+
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            usage = max(
+                usage,
+                float(entry.get("call_count") or 0),
+                float(entry.get("total_time") or 0),
+                float(entry.get("total_cputime") or 0),
+            )
+            regain = max(
+                regain, float(entry.get("estimated_time_to_regain_access") or 0) * 60
+            )
+
+    return usage, regain
+
+
+def _post_summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a Graph API post (with like/comment summaries) for display"""
+    get = item.get
+    return {
+        "id": get("id"),
+        "message": (get("message") or "")[:100],
+        "created_time": get("created_time"),
+        "url": get("permalink_url"),
+        "shares": (get("shares") or {}).get("count", 0),
+        "likes": ((get("likes") or {}).get("summary") or {}).get("total_count", 0),
+        "comments": ((get("comments") or {}).get("summary") or {}).get(
+            "total_count", 0
+        ),
+    }
+
 
 class FacebookPublisher:
     """
@@ -40,26 +211,164 @@ class FacebookPublisher:
 
     GRAPH_API_URL = "https://graph.facebook.com/v18.0"
 
-    def __init__(self, config: ConfigManager):
+    # Graph `fields`/`metric` query values
+    PAGE_FIELDS = "id,name,about,fan_count,link,picture"
+    POST_FIELDS = (
+        "id,message,created_time,permalink_url,shares,"
+        "likes.summary(true),comments.summary(true)"
+    )
+    DEFAULT_METRICS = (
+        "page_impressions",
+        "page_engaged_users",
+        "page_fans",
+        "page_views_total",
+    )
+    DEFAULT_METRICS_PARAM = ",".join(DEFAULT_METRICS)
+
+    # Seconds slow-changing lookups are reused for (dashboards poll these)
+    PAGE_INFO_TTL = 60.0
+    VERIFY_TOKEN_TTL = 60.0
+    TOKEN_INFO_TTL = 300.0
+
+    def __init__(
+        self, config: ConfigManager, client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Facebook Publisher
 
         Args:
             config: ConfigManager instance
+            client: Optional HTTP client (defaults to the shared publisher client)
         """
         self.config = config
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client: Optional[httpx.AsyncClient] = client
+
+        # Settings derived from config, re-derived only when it is (re)loaded
+        self._config_snapshot = None
+        self._configured = False
+        self._page_id = ""
+        self._access_token = ""
+        self._auth_headers: Dict[str, str] = {}
+        self._graph_url = httpx.URL(self.GRAPH_API_URL)
+        self._debug_token_url = httpx.URL(f"{self.GRAPH_API_URL}/debug_token")
+        self._sync_config()
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=60.0)
-        return self._http_client
+        """Get HTTP client (injected, or the shared pooled client)"""
+        return self._http_client or get_shared_client()
 
     async def close(self):
-        """Close HTTP client"""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
+        """Release resources (HTTP clients are shared/owned by the caller)"""
+        self._http_client = None
+
+    async def _request(
+        self,
+        method: str,
+        url: Union[str, httpx.URL],
+        probe: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Rate-limited Graph API call that backs off as quota usage nears the cap
+
+        Raises FacebookAuthError without sending anything while the token
+        circuit breaker is open, and FacebookThrottledError while the Page is
+        paused for longer than _USAGE_PAUSE_CAP (shorter pauses are waited
+        out). `probe` calls (token checks) skip both.
+        """
+        page_id = self._page_id
+        token = self._access_token
+        if not probe:
+            now = time.monotonic()
+            if now < _auth_open_until.get(token, 0.0):
+                raise FacebookAuthError(
+                    "Facebook token rejected repeatedly; calls paused until it verifies"
+                )
+
+            delay = _pause_until.get(page_id, 0.0) - now
+            if delay > _USAGE_PAUSE_CAP:
+                raise FacebookThrottledError(
+                    f"Facebook API quota exhausted; calls paused for {delay:.0f}s"
+                )
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        client = await self._get_client()
+        headers = {**self._auth_headers, **kwargs.pop("headers", {})}
+        async with self._limiter:
+            response = await client.request(method, url, headers=headers, **kwargs)
+
+        pause = _usage_pause(response.headers)
+        if pause:
+            logger.warning(f"Facebook API usage high, holding off for {pause:.0f}s")
+            _pause_until[page_id] = time.monotonic() + pause
+
+        self._track_auth(token, response)
+        return response
+
+    @staticmethod
+    def _track_auth(token: str, response: httpx.Response):
+        """Count invalid-token responses in a row and open the breaker at the limit"""
+        if response.is_success:
+            _auth_failures.pop(token, None)
+            return
+        if response.status_code not in (400, 401) or _error_code(response) != 190:
+            return
+
+        failures = _auth_failures[token] = _auth_failures.get(token, 0) + 1
+        if failures >= _AUTH_FAILURE_LIMIT:
+            logger.error(
+                f"Facebook token rejected {failures} times in a row, "
+                f"pausing calls for {_AUTH_COOLDOWN:.0f}s"
+            )
+            _auth_open_until[token] = time.monotonic() + _AUTH_COOLDOWN
+
+    @staticmethod
+    def _reset_auth(token: str):
+        """Close the circuit breaker for a token"""
+        _auth_failures.pop(token, None)
+        _auth_open_until.pop(token, None)
+
+    async def _call(
+        self, action: str, method: str, url: Union[str, httpx.URL], **kwargs
+    ) -> Optional[Any]:
+        """
+        Graph API call returning the parsed JSON body, or None on failure
+
+        Failures are logged here once, as "Failed to <action>: ...".
+        """
+        try:
+            response = await self._request(method, url, **kwargs)
+            response.raise_for_status()
+            return read_json(response) if response.content else {}
+        except Exception as e:
+            logger.error(f"Failed to {action}: {_describe_error(e)}")
+            return None
+
+    def _cached(self, key: str, max_age: float) -> Optional[Any]:
+        """Value stored under `key` by _remember() if younger than `max_age`"""
+        entry = self._lookups.get(key)
+        if entry and time.monotonic() - entry[0] < max_age:
+            return entry[1]
+        return None
+
+    def _remember(self, key: str, value: Any) -> Any:
+        self._lookups[key] = (time.monotonic(), value)
+        return value
+
+    async def _debug_token(self, action: str, max_age: float) -> Optional[Dict]:
+        """`debug_token` data for the Page token, reused while younger than `max_age`"""
+        data = self._cached("debug_token", max_age)
+        if data is not None:
+            return data
+
+        params = {"input_token": self._access_token}
+        body = await self._call(
+            action, "GET", self._debug_token_url, params=params, probe=True
+        )
+        if body is None:
+            return None
+        return self._remember("debug_token", body.get("data") or {})
 
     @property
     def facebook_config(self):
@@ -69,24 +378,53 @@ class FacebookPublisher:
     @property
     def page_id(self) -> str:
         """Get Page ID"""
-        return self.facebook_config.page_id
+        self._sync_config()
+        return self._page_id
 
     @property
     def access_token(self) -> str:
         """Get Page Access Token"""
-        return self.facebook_config.page_access_token
+        self._sync_config()
+        return self._access_token
 
     def is_configured(self) -> bool:
         """Check if Facebook is properly configured"""
-        return self.config.is_configured("facebook")
+        self._sync_config()
+        return self._configured
+
+    def _sync_config(self):
+        """Refresh cached settings if the AppConfig instance changed (reload)"""
+        app_config = self.config.app_config
+        if app_config is self._config_snapshot:
+            return
+
+        facebook = app_config.facebook
+        self._config_snapshot = app_config
+        self._configured = self.config.is_configured("facebook")
+        # key -> (monotonic fetch time, value), see _cached()
+        self._lookups: Dict[str, Tuple[float, Any]] = {}
+        self._page_id = facebook.page_id if facebook else ""
+        self._access_token = facebook.page_access_token if facebook else ""
+        # Sent as a header so the token stays out of URLs and request logs
+        self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+
+        # Parsed once here rather than by httpx on every request
+        page_url = f"{self.GRAPH_API_URL}/{self._page_id}"
+        self._page_url = httpx.URL(page_url)
+        self._feed_url = httpx.URL(f"{page_url}/feed")
+        self._photos_url = httpx.URL(f"{page_url}/photos")
+        self._posts_url = httpx.URL(f"{page_url}/posts")
+        self._insights_url = httpx.URL(f"{page_url}/insights")
+
+        # Shared per Page across publisher instances
+        self._limiter = get_throttler(
+            f"facebook:{self._page_id}", rate_limit=200, period=3600.0
+        )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PUBLISHING
     # ═══════════════════════════════════════════════════════════════════════════
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=30)
-    )
     async def publish_post(
         self,
         message: str,
@@ -108,50 +446,59 @@ class FacebookPublisher:
             logger.error("Facebook not configured")
             return None
 
-        client = await self._get_client()
+        try:
+            return await with_retries(
+                lambda: self._publish_post_once(message, link, scheduled_time),
+                _is_transient,
+            )
+        except Exception as e:
+            logger.error(f"Facebook publish failed after retries: {_describe_error(e)}")
+            return None
 
-        url = f"{self.GRAPH_API_URL}/{self.page_id}/feed"
+    async def _publish_post_once(
+        self,
+        message: str,
+        link: Optional[str],
+        scheduled_time: Optional[datetime],
+    ) -> Optional[str]:
+        """Single publish attempt; raises only for retriable failures"""
+        url = self._feed_url
 
-        params = {"access_token": self.access_token, "message": message}
+        # Message goes in the form body: a long (Arabic) message percent-encoded
+        # into the query string roughly triples the request line
+        data: Dict[str, Any] = {"message": message}
 
         if link:
-            params["link"] = link
+            data["link"] = link
 
         if scheduled_time:
             # Convert to Unix timestamp
-            params["published"] = "false"
-            params["scheduled_publish_time"] = int(scheduled_time.timestamp())
+            data["published"] = "false"
+            data["scheduled_publish_time"] = int(scheduled_time.timestamp())
 
         try:
-            response = await client.post(url, params=params)
+            response = await self._request("POST", url, data=data)
             response.raise_for_status()
 
-            data = response.json()
+            data = read_json(response)
             post_id = data.get("id")
 
             logger.info(f"✅ Published to Facebook: post_id={post_id}")
             return post_id
 
         except httpx.HTTPStatusError as e:
-            error_data = e.response.json() if e.response.text else {}
-            error_msg = error_data.get("error", {}).get("message", str(e))
-            logger.error(f"Facebook publish failed: {error_msg}")
-
-            # Handle specific errors
-            error_code = error_data.get("error", {}).get("code")
-            if error_code == 190:
-                logger.error("Access token expired or invalid")
-            elif error_code == 200:
-                logger.error("Permission denied. Check Page access.")
-
+            if _is_transient(e):
+                # Throttled / server-side failure: let with_retries retry
+                raise
+            logger.error(f"Facebook publish failed: {_describe_error(e)}")
             return None
+        except _UNSENT_ERRORS:
+            # Never reached Facebook: let with_retries retry
+            raise
         except Exception as e:
             logger.error(f"Facebook publish error: {e}")
             return None
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=30)
-    )
     async def publish_photo(self, message: str, photo_url: str) -> Optional[str]:
         """
         Publish a photo post to Facebook Page
@@ -166,34 +513,29 @@ class FacebookPublisher:
         if not self.is_configured():
             return None
 
-        client = await self._get_client()
+        url = self._photos_url
 
-        url = f"{self.GRAPH_API_URL}/{self.page_id}/photos"
+        data = {"caption": message, "url": photo_url}
 
-        params = {
-            "access_token": self.access_token,
-            "caption": message,
-            "url": photo_url,
-        }
+        async def _send() -> httpx.Response:
+            response = await self._request("POST", url, data=data)
+            response.raise_for_status()
+            return response
 
         try:
-            response = await client.post(url, params=params)
-            response.raise_for_status()
+            response = await with_retries(_send, _is_transient)
 
-            data = response.json()
+            data = read_json(response)
             post_id = data.get("post_id") or data.get("id")
 
             logger.info(f"✅ Published photo to Facebook: {post_id}")
             return post_id
 
         except Exception as e:
-            logger.error(f"Facebook photo publish failed: {e}")
+            logger.error(f"Facebook photo publish failed: {_describe_error(e)}")
             # Fallback to text post with link
             return await self.publish_post(f"{message}\n\n📷 {photo_url}")
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=30)
-    )
     async def publish_photos(
         self, message: str, photo_urls: List[str]
     ) -> Optional[str]:
@@ -201,59 +543,166 @@ class FacebookPublisher:
         if not self.is_configured():
             return None
 
-        urls = [u for u in (photo_urls or []) if (u or "").strip()]
+        # Keep it reasonable; FB supports more, but this avoids rate/timeout issues.
+        urls = [u for u in (photo_urls or ()) if u and _PHOTO_URL.fullmatch(u)][:10]
         if not urls:
             return await self.publish_post(message)
 
-        # Keep it reasonable; FB supports more, but this avoids rate/timeout issues.
-        urls = urls[:10]
+        try:
+            post_id, uploaded = await self._publish_photos_batch(message, urls)
+            if not post_id:
+                # An operation in the batch failed: create the post from the
+                # photos that did upload, uploading only the missing ones again
+                post_id = await self._publish_photos_separately(message, urls, uploaded)
+            return post_id
 
-        client = await self._get_client()
+        except Exception as e:
+            logger.error(f"Facebook multi-photo publish failed: {_describe_error(e)}")
+            if not _not_applied(e):
+                # The post may have gone through (e.g. read timeout after the
+                # batch ran): posting again could publish it twice
+                return None
+            return await self.publish_photo(message, urls[0])
 
-        try:
-            media_fbids: List[str] = []
-            upload_url = f"{self.GRAPH_API_URL}/{self.page_id}/photos"
-
-            # 1) Upload photos as unpublished
-            for url in urls:
-                params = {
-                    "access_token": self.access_token,
-                    "url": url,
-                    "published": "false",
-                }
-                r = await client.post(upload_url, params=params)
-                r.raise_for_status()
-                data = r.json()
-                media_id = data.get("id")
-                if media_id:
-                    media_fbids.append(str(media_id))
-
-            if not media_fbids:
-                return await self.publish_photo(message, urls[0])
-
-            # 2) Create feed post with attached_media
-            feed_url = f"{self.GRAPH_API_URL}/{self.page_id}/feed"
-            params: Dict[str, Any] = {
-                "access_token": self.access_token,
-                "message": message,
+    async def _publish_photos_batch(
+        self, message: str, urls: List[str]
+    ) -> Tuple[Optional[str], Dict[int, str]]:
+        """
+        Upload the photos and create the feed post in one Graph batch request
+
+        The feed post picks up the unpublished photo ids through JSONPath
+        references, so the whole post costs a single round-trip.
+
+        Returns:
+            (post ID or None if any operation in the batch failed,
+             {url index: photo id} of the photos that were uploaded)
+        """
+        batch: List[Dict[str, Any]] = [
+            {
+                "method": "POST",
+                "relative_url": f"{self._page_id}/photos",
+                "body": urlencode({"url": url, "published": "false"}),
+                "name": f"photo{i}",
+                # Referenced results are dropped by default; keep the ids so
+                # a failed feed post can reuse the uploaded photos
+                "omit_response_on_success": False,
+            }
+            for i, url in enumerate(urls)
+        ]
+        # References are resolved server-side before the body is parsed,
+        # so they must stay unencoded
+        feed_body = "&".join(
+            [f"message={quote(message, safe='')}"]
+            + [
+                f'attached_media[{i}]={{"media_fbid":"{{result=photo{i}:$.id}}"}}'
+                for i in range(len(urls))
+            ]
+        )
+        batch.append(
+            {
+                "method": "POST",
+                "relative_url": f"{self._page_id}/feed",
+                "body": feed_body,
             }
-            for i, fbid in enumerate(media_fbids):
-                params[f"attached_media[{i}]"] = json.dumps({"media_fbid": fbid})
+        )
+
+        response = await self._request(
+            "POST", self._graph_url, data={"batch": orjson.dumps(batch).decode()}
+        )
+        response.raise_for_status()
+
+        # One entry per operation; null when it was skipped (failed dependency)
+        results = read_json(response) or [None]
+        uploaded = {
+            i: str(photo_id)
+            for i, result in enumerate(results[: len(urls)])
+            if result and result.get("code") == 200
+            if (photo_id := orjson.loads(result["body"]).get("id"))
+        }
+        feed = results[-1]
+        if not feed or feed.get("code") != 200:
+            failed = next((r for r in results if r and r.get("code") != 200), None)
+            error = orjson.loads(failed["body"]).get("error", {}) if failed else {}
+            reason = error.get("message", "no result")
+            logger.warning(f"Facebook batch photo publish failed: {reason}")
+            return None, uploaded
+
+        post_id = orjson.loads(feed["body"]).get("id")
+        logger.info(
+            f"✅ Published multi-photo to Facebook: post_id={post_id} photos={len(urls)}"
+        )
+        return post_id, uploaded
+
+    async def _publish_photos_separately(
+        self, message: str, urls: List[str], uploaded: Optional[Dict[int, str]] = None
+    ) -> Optional[str]:
+        """
+        Upload photos one request each, skip failed ones, then create the post
 
-            r2 = await client.post(feed_url, data=params)
-            r2.raise_for_status()
-            data2 = r2.json()
-            post_id = data2.get("id")
+        `uploaded` maps url index -> id of photos already uploaded (by a
+        failed batch); those are attached as-is instead of uploaded again.
+        """
+        uploaded = uploaded or {}
+        upload_url = self._photos_url
+        semaphore = asyncio.Semaphore(5)  # Stay within per-Page rate limits
+
+        async def _upload(url: str) -> Optional[str]:
+            data = {"url": url, "published": "false"}
+            try:
+                async with semaphore:
+                    r = await self._request("POST", upload_url, data=data)
+                r.raise_for_status()
+                return read_json(r).get("id")
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                if (
+                    isinstance(e, httpx.HTTPStatusError)
+                    and _error_code(e.response) in _PERMANENT_CODES
+                ):
+                    # Bad token / permission: every other upload fails too
+                    raise
+                # Only this photo is skipped; the others carry on
+                logger.warning(
+                    f"Facebook photo upload failed ({url}): {_describe_error(e)}"
+                )
+                return None
+
+        # 1) Upload photos as unpublished (concurrently, order preserved).
+        # A token/permission error or an open breaker cancels the rest.
+        async with asyncio.TaskGroup() as tg:
+            uploads = {
+                i: tg.create_task(_upload(url))
+                for i, url in enumerate(urls)
+                if i not in uploaded
+            }
 
-            logger.info(
-                f"✅ Published multi-photo to Facebook: post_id={post_id} photos={len(media_fbids)}"
-            )
-            return post_id
+        photo_ids = (
+            uploaded[i] if i in uploaded else uploads[i].result()
+            for i in range(len(urls))
+        )
+        media_fbids = [str(fbid) for fbid in photo_ids if fbid]
 
-        except Exception as e:
-            logger.error(f"Facebook multi-photo publish failed: {e}")
+        if not media_fbids:
             return await self.publish_photo(message, urls[0])
 
+        # 2) Create feed post with attached_media
+        feed_url = self._feed_url
+        params: Dict[str, Any] = {"message": message}
+        # Graph object ids are plain digits: no JSON escaping needed
+        params.update(
+            (f"attached_media[{i}]", f'{{"media_fbid":"{fbid}"}}')
+            for i, fbid in enumerate(media_fbids)
+        )
+
+        r2 = await self._request("POST", feed_url, data=params)
+        r2.raise_for_status()
+        data2 = read_json(r2)
+        post_id = data2.get("id")
+
+        logger.info(
+            f"✅ Published multi-photo to Facebook: post_id={post_id} photos={len(media_fbids)}"
+        )
+        return post_id
+
     # ═══════════════════════════════════════════════════════════════════════════
     # PAGE INFO
     # ═══════════════════════════════════════════════════════════════════════════
@@ -268,31 +717,25 @@ class FacebookPublisher:
         if not self.is_configured():
             return None
 
-        client = await self._get_client()
-
-        url = f"{self.GRAPH_API_URL}/{self.page_id}"
-        params = {
-            "access_token": self.access_token,
-            "fields": "id,name,about,fan_count,link,picture",
-        }
-
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+        info = self._cached("page_info", self.PAGE_INFO_TTL)
+        if info is not None:
+            return dict(info)
 
-            data = response.json()
-            return {
-                "id": data.get("id"),
-                "name": data.get("name"),
-                "about": data.get("about"),
-                "followers": data.get("fan_count", 0),
-                "url": data.get("link"),
-                "picture": data.get("picture", {}).get("data", {}).get("url"),
-            }
-        except Exception as e:
-            logger.error(f"Failed to get page info: {e}")
+        params = {"fields": self.PAGE_FIELDS}
+        data = await self._call("get page info", "GET", self._page_url, params=params)
+        if data is None:
             return None
 
+        info = {
+            "id": data.get("id"),
+            "name": data.get("name"),
+            "about": data.get("about"),
+            "followers": data.get("fan_count", 0),
+            "url": data.get("link"),
+            "picture": data.get("picture", {}).get("data", {}).get("url"),
+        }
+        return dict(self._remember("page_info", info))
+
     async def get_recent_posts(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get recent posts from the Page
@@ -303,46 +746,64 @@ class FacebookPublisher:
         Returns:
             List of post info dicts
         """
-        if not self.is_configured():
-            return []
+        posts: List[Dict[str, Any]] = []
+        if limit <= 0:
+            return posts
 
-        client = await self._get_client()
+        async with aclosing(self.iter_recent_posts(page_size=min(limit, 100))) as it:
+            async for post in it:
+                posts.append(post)
+                if len(posts) >= limit:
+                    break
+        return posts
 
-        url = f"{self.GRAPH_API_URL}/{self.page_id}/posts"
-        params = {
-            "access_token": self.access_token,
-            "fields": "id,message,created_time,permalink_url,shares,likes.summary(true),comments.summary(true)",
-            "limit": limit,
-        }
+    async def iter_recent_posts(
+        self, page_size: int = 25
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the Page's posts, newest first, one page at a time
 
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+        The next page is only requested once the current one has been
+        consumed, so callers that stop early don't pay for the rest.
 
-            data = response.json()
-            posts = []
-
-            for item in data.get("data", []):
-                posts.append(
-                    {
-                        "id": item.get("id"),
-                        "message": item.get("message", "")[:100],
-                        "created_time": item.get("created_time"),
-                        "url": item.get("permalink_url"),
-                        "shares": item.get("shares", {}).get("count", 0),
-                        "likes": item.get("likes", {})
-                        .get("summary", {})
-                        .get("total_count", 0),
-                        "comments": item.get("comments", {})
-                        .get("summary", {})
-                        .get("total_count", 0),
-                    }
-                )
+        Args:
+            page_size: Posts per request (Graph API caps this at 100)
 
-            return posts
+        Yields:
+            Post info dicts
+        """
+        if not self.is_configured():
+            return
+
+        after: Optional[str] = None
+        try:
+            while True:
+                data = await self._fetch_posts_page(after, page_size)
+                for item in data.get("data", ()):
+                    yield _post_summary(item)
+
+                paging = data.get("paging") or {}
+                after = (paging.get("cursors") or {}).get("after")
+                if not paging.get("next") or not after:
+                    return
         except Exception as e:
             logger.error(f"Failed to get posts: {e}")
-            return []
+
+    @idempotent_retry
+    async def _fetch_posts_page(
+        self, after: Optional[str], page_size: int
+    ) -> Dict[str, Any]:
+        """Fetch one raw page of `GET /{page_id}/posts`"""
+        params: Dict[str, Any] = {
+            "fields": self.POST_FIELDS,
+            "limit": page_size,
+        }
+        if after:
+            params["after"] = after
+
+        response = await self._request("GET", self._posts_url, params=params)
+        response.raise_for_status()
+        return read_json(response)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # POST MANAGEMENT
@@ -361,20 +822,13 @@ class FacebookPublisher:
         if not self.is_configured():
             return False
 
-        client = await self._get_client()
-
         url = f"{self.GRAPH_API_URL}/{post_id}"
-        params = {"access_token": self.access_token}
-
-        try:
-            response = await client.delete(url, params=params)
-            response.raise_for_status()
-            logger.info(f"✅ Deleted Facebook post: {post_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to delete post: {e}")
+        if await self._call("delete post", "DELETE", url) is None:
             return False
 
+        logger.info(f"✅ Deleted Facebook post: {post_id}")
+        return True
+
     async def update_post(self, post_id: str, message: str) -> bool:
         """
         Update a post's message
@@ -389,20 +843,14 @@ class FacebookPublisher:
         if not self.is_configured():
             return False
 
-        client = await self._get_client()
-
         url = f"{self.GRAPH_API_URL}/{post_id}"
-        params = {"access_token": self.access_token, "message": message}
-
-        try:
-            response = await client.post(url, params=params)
-            response.raise_for_status()
-            logger.info(f"✅ Updated Facebook post: {post_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update post: {e}")
+        data = {"message": message}
+        if await self._call("update post", "POST", url, data=data) is None:
             return False
 
+        logger.info(f"✅ Updated Facebook post: {post_id}")
+        return True
+
     # ═══════════════════════════════════════════════════════════════════════════
     # TOKEN MANAGEMENT
     # ═══════════════════════════════════════════════════════════════════════════
@@ -417,33 +865,23 @@ class FacebookPublisher:
         if not self.is_configured():
             return False
 
-        client = await self._get_client()
-
-        url = f"{self.GRAPH_API_URL}/debug_token"
-        params = {"input_token": self.access_token, "access_token": self.access_token}
-
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json().get("data", {})
-
-            if data.get("is_valid"):
-                expires_at = data.get("expires_at", 0)
-                if expires_at == 0:
-                    logger.info("Token is valid (never expires)")
-                else:
-                    from datetime import datetime
+        # Re-check right away once the token has been rejected
+        max_age = 0.0 if self._access_token in _auth_failures else self.VERIFY_TOKEN_TTL
+        data = await self._debug_token("verify token", max_age)
+        if data is None:
+            return False
 
-                    expires = datetime.fromtimestamp(expires_at)
-                    logger.info(f"Token is valid until {expires}")
-                return True
+        if data.get("is_valid"):
+            self._reset_auth(self._access_token)
+            expires_at = data.get("expires_at", 0)
+            if expires_at == 0:
+                logger.info("Token is valid (never expires)")
             else:
-                logger.error("Token is invalid")
-                return False
-
-        except Exception as e:
-            logger.error(f"Token verification failed: {e}")
+                expires = datetime.fromtimestamp(expires_at)
+                logger.info(f"Token is valid until {expires}")
+            return True
+        else:
+            logger.error("Token is invalid")
             return False
 
     async def get_token_info(self) -> Optional[Dict[str, Any]]:
@@ -456,34 +894,24 @@ class FacebookPublisher:
         if not self.is_configured():
             return None
 
-        client = await self._get_client()
-
-        url = f"{self.GRAPH_API_URL}/debug_token"
-        params = {"input_token": self.access_token, "access_token": self.access_token}
-
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json().get("data", {})
-
-            return {
-                "is_valid": data.get("is_valid"),
-                "app_id": data.get("app_id"),
-                "type": data.get("type"),
-                "expires_at": data.get("expires_at"),
-                "scopes": data.get("scopes", []),
-            }
-        except Exception as e:
-            logger.error(f"Failed to get token info: {e}")
+        data = await self._debug_token("get token info", self.TOKEN_INFO_TTL)
+        if data is None:
             return None
 
+        return {
+            "is_valid": data.get("is_valid"),
+            "app_id": data.get("app_id"),
+            "type": data.get("type"),
+            "expires_at": data.get("expires_at"),
+            "scopes": data.get("scopes", []),
+        }
+
     # ═══════════════════════════════════════════════════════════════════════════
     # INSIGHTS (ANALYTICS)
     # ═══════════════════════════════════════════════════════════════════════════
 
     async def get_page_insights(
-        self, metrics: List[str] = None
+        self, metrics: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Get Page insights/analytics
@@ -497,37 +925,16 @@ class FacebookPublisher:
         if not self.is_configured():
             return None
 
-        if not metrics:
-            metrics = [
-                "page_impressions",
-                "page_engaged_users",
-                "page_fans",
-                "page_views_total",
-            ]
-
-        client = await self._get_client()
+        metric = ",".join(metrics) if metrics else self.DEFAULT_METRICS_PARAM
+        params = {"metric": metric, "period": "day"}
+        data = await self._call(
+            "get insights", "GET", self._insights_url, params=params
+        )
+        if data is None:
+            return None
 
-        url = f"{self.GRAPH_API_URL}/{self.page_id}/insights"
-        params = {
-            "access_token": self.access_token,
-            "metric": ",".join(metrics),
-            "period": "day",
+        return {
+            item.get("name"): item["values"][-1].get("value", 0)
+            for item in data.get("data", ())
+            if item.get("values")
         }
-
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
-
-            insights = {}
-            for item in data.get("data", []):
-                name = item.get("name")
-                values = item.get("values", [])
-                if values:
-                    insights[name] = values[-1].get("value", 0)
-
-            return insights
-        except Exception as e:
-            logger.error(f"Failed to get insights: {e}")
-            return None
@@ -0,0 +1,383 @@
+"""
+ContentOrbit Enterprise - Shared Publisher HTTP Client
+=======================================================
+A single pooled httpx.AsyncClient shared by the API publishers, so TCP/TLS
+connections (and HTTP/2 streams) are reused across publish calls and across
+publisher instances instead of being re-established per instance.
+
+Usage:
+    from core.publisher.http import get_shared_client, close_shared_client
+
+    # Application entry point: bind one client for everything run inside
+    async with publisher_lifespan():
+        await run_app()
+
+    client = get_shared_client()
+    response = await client.get(url, headers=headers)
+
+    # Proactive per-host rate limiting
+    async with get_throttler("devto", rate_limit=10, period=30.0):
+        response = await client.post(url, json=payload)
+
+    # JSON bodies/responses via orjson
+    response = await send_json(client, "POST", url, payload, headers=headers)
+    data = read_json(response)
+
+    # Retry idempotent reads on transport errors / 429 / 5xx
+    @idempotent_retry
+    async def fetch(): ...
+
+    # Retry a write only when `is_retryable_write` says nothing was created
+    await with_retries(lambda: send_json(...), is_retryable_write)
+
+    # On application shutdown
+    await close_shared_client()
+"""
+
+import asyncio
+import functools
+import random
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from hashlib import blake2b
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Set,
+    TypeVar,
+)
+import logging
+
+import httpx
+import orjson
+from asyncio_throttle import Throttler
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1.
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+    logger.warning(
+        "h2 not installed: publisher requests fall back to HTTP/1.1 "
+        "(install httpx[http2] for multiplexed uploads)"
+    )
+
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=50, max_connections=100, keepalive_expiry=90
+)
+DEFAULT_HEADERS = {"User-Agent": "ContentOrbit/1.0"}
+
+# One process-wide client per event loop: an AsyncClient's connections are
+# bound to the loop that opened them. Entries go away with their loop.
+_shared_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Client bound by publisher_lifespan(); inherited by tasks spawned inside it
+HTTP_CLIENT: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "publisher_http_client", default=None
+)
+
+_throttlers: Dict[str, Throttler] = {}
+
+# Hosts whose negotiated protocol has already been logged
+_protocol_logged: Set[str] = set()
+
+
+async def _log_protocol(response: httpx.Response):
+    """Log once per host whether HTTP/2 (one multiplexed connection) is in use"""
+    host = response.request.url.host
+    if host not in _protocol_logged:
+        _protocol_logged.add(host)
+        logger.debug("Publisher connection to %s uses %s", host, response.http_version)
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=DEFAULT_TIMEOUT,
+        limits=DEFAULT_LIMITS,
+        headers=DEFAULT_HEADERS,
+        event_hooks={"response": [_log_protocol]},
+    )
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the publisher HTTP client.
+
+    Returns the client bound by an enclosing `publisher_lifespan()` if there
+    is one, otherwise the running loop's shared client, created on first use.
+
+    The client is app-agnostic (no auth headers); pass credentials per request.
+    Each event loop gets its own client (rebuilt if it was closed), so a
+    client is never used from, or replaced under, another loop.
+    """
+    bound = HTTP_CLIENT.get()
+    if bound is not None and not bound.is_closed:
+        return bound
+
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _shared_clients[loop] = _new_client()
+        # Loops discarded mid-run (e.g. a finished asyncio.run) leak their pool
+        weakref.finalize(loop, _warn_unclosed, client).atexit = False
+    return client
+
+
+def _warn_unclosed(client: httpx.AsyncClient):
+    """Called when a loop goes away; its client can no longer be closed"""
+    if not client.is_closed:
+        logger.warning(
+            "Shared publisher HTTP client dropped with its event loop without "
+            "close_shared_client(); its pooled connections were leaked"
+        )
+
+
+async def close_shared_client():
+    """Close the running loop's shared HTTP client (call on shutdown)"""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def publisher_lifespan(
+    client: Optional[httpx.AsyncClient] = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Bind one long-lived HTTP client for all publishers used inside the block.
+
+    Args:
+        client: Client to bind (owned by the caller); a pooled one is
+            created and closed on exit if omitted
+    """
+    owned = client is None
+    if owned:
+        client = _new_client()
+
+    token = HTTP_CLIENT.set(client)
+    try:
+        yield client
+    finally:
+        HTTP_CLIENT.reset(token)
+        if owned:
+            await client.aclose()
+
+
+def get_throttler(host: str, rate_limit: int, period: float = 1.0) -> Throttler:
+    """
+    Get the process-wide rate limiter for an API host.
+
+    All publisher instances talking to the same host share one limiter, so
+    requests are throttled before they are sent instead of backing off
+    after a 429. The limits are refreshed on every call so config edits apply.
+    """
+    throttler = _throttlers.get(host)
+    if throttler is None:
+        throttler = _throttlers[host] = Throttler(rate_limit=rate_limit, period=period)
+    else:
+        throttler.rate_limit = rate_limit
+        throttler.period = period
+    return throttler
+
+
+async def send_json(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    obj: Any,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> httpx.Response:
+    """
+    Send `obj` as a JSON request body, serialized straight to bytes by orjson.
+
+    `obj` may also be pre-serialized JSON bytes (e.g. a payload built once
+    and reused across retries), which are sent as-is.
+    """
+    if not headers or "Content-Type" not in headers:
+        headers = {**(headers or {}), "Content-Type": "application/json"}
+    body = obj if isinstance(obj, bytes) else orjson.dumps(obj)
+    return await client.request(
+        method, url, content=body, headers=headers, params=params
+    )
+
+
+def read_json(response: httpx.Response) -> Any:
+    """Parse a JSON response body with orjson"""
+    return orjson.loads(response.content)
+
+
+def error_body(response: httpx.Response, limit: int = 4096) -> str:
+    """Decode at most `limit` bytes of an error response body for logging"""
+    return response.content[:limit].decode("utf-8", "replace")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RETRY POLICY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_AFTER_CAP = 120.0
+
+T = TypeVar("T")
+
+_jitter = random.SystemRandom()
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait (`Retry-After`), if it said"""
+    # SDK flood-control errors (e.g. aiogram's TelegramRetryAfter) carry it parsed
+    delay = getattr(exc, "retry_after", None)
+    if isinstance(delay, (int, float)):
+        return float(delay)
+
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+
+    value = exc.response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_retryable_read(exc: BaseException) -> bool:
+    """Idempotent requests can be retried on any transient failure"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+def is_retryable_write(exc: BaseException) -> bool:
+    """
+    Non-idempotent requests are only retried when the server rejected them
+    before acting: 429, or 503 with a `Retry-After` (deliberate load shedding).
+
+    Anything else may have been applied upstream and retrying could publish
+    twice: 502/504 only mean a gateway gave up waiting, and transport errors
+    may hit after the request went through. Those are left to the caller.
+    """
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+
+    code = exc.response.status_code
+    if code == 429:
+        return True
+    return code == 503 and "Retry-After" in exc.response.headers
+
+
+async def with_retries(
+    call: Callable[[], Awaitable[T]],
+    should_retry: Callable[[BaseException], bool],
+    attempts: int = 3,
+    base: float = 4.0,
+    cap: float = 30.0,
+) -> T:
+    """
+    Await `call()` until it succeeds, retrying failures `should_retry` accepts.
+
+    Waits `Retry-After` when the server sent one, otherwise `base * 2**n`
+    (capped) plus up to 50% random jitter. The last error is re-raised.
+
+    Args:
+        call: Zero-argument factory returning a fresh awaitable per attempt
+        should_retry: Predicate deciding if an exception is retriable
+        attempts: Total number of attempts
+        base: First backoff delay in seconds
+        cap: Maximum backoff delay in seconds (before jitter)
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return await call()
+        except Exception as exc:
+            if attempt == attempts or not should_retry(exc):
+                raise
+
+            delay = retry_after(exc)
+            if delay is None:
+                delay = min(cap, base * 2 ** (attempt - 1))
+                delay += _jitter.uniform(0, delay / 2)
+            else:
+                delay = min(delay, RETRY_AFTER_CAP)
+
+            logger.debug(
+                "Attempt %d/%d failed (%s), retrying in %.1fs",
+                attempt,
+                attempts,
+                exc,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+
+def idempotent_retry(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Decorator: retry an idempotent request up to 5 times on transient failures"""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await with_retries(
+            lambda: func(*args, **kwargs), is_retryable_read, attempts=5, base=2.0
+        )
+
+    return wrapper
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# UPDATE DEDUPLICATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class PatchDigests:
+    """
+    Bounded LRU of the last update payload sent per remote resource.
+
+    Lets updaters skip the round-trip when asked to send the exact same
+    patch again (e.g. re-sync jobs). Edits made outside this process
+    are not seen, so only successful sends should be remembered.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self._digests: "OrderedDict[Any, bytes]" = OrderedDict()
+
+    @staticmethod
+    def digest(payload: Any) -> bytes:
+        return blake2b(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).digest()
+
+    def matches(self, key: Any, digest: bytes) -> bool:
+        """Check if `digest` is what was last sent for `key`"""
+        if self._digests.get(key) != digest:
+            return False
+        self._digests.move_to_end(key)
+        return True
+
+    def remember(self, key: Any, digest: bytes):
+        self._digests[key] = digest
+        self._digests.move_to_end(key)
+        if len(self._digests) > self.maxsize:
+            self._digests.popitem(last=False)
+
+    def forget(self, key: Any):
+        self._digests.pop(key, None)
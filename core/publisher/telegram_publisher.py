@@ -14,30 +14,168 @@ Usage:
 
     publisher = TelegramPublisher(config)
     message_id = await publisher.publish_post(text, image_url)
+
+    # Keep one publisher for the app's lifetime so the bot session (and its
+    # open TLS connections to Telegram) is reused; close it on shutdown
+    await publisher.close()
 """
 
 import asyncio
-from typing import Optional, List, Union
+from collections import OrderedDict
+import html
+from typing import Optional, List, Tuple, Union
 from pathlib import Path
 import logging
 import io
+import ssl
+import time
+from urllib.parse import urlsplit
 
+import aiogram
+import certifi
 import httpx
+from aiohttp import ClientSession, TCPConnector
 from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.types import (
     FSInputFile,
+    InputFile,
     URLInputFile,
     BufferedInputFile,
     InputMediaPhoto,
 )
 from aiogram.enums import ParseMode
-from tenacity import retry, stop_after_attempt, wait_exponential
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
 
 from core.config_manager import ConfigManager
+from core.publisher.http import get_shared_client, with_retries
 
 logger = logging.getLogger(__name__)
 
 
+# Telegram message/caption limits, counted in UTF-16 code units
+MESSAGE_LIMIT = 4096
+CAPTION_LIMIT = 1024
+# Ends a shortened caption when the full text follows as its own message
+READ_MORE = "\n\n⬇️ <b>التفاصيل والروابط بالأسفل</b>"
+
+
+def _utf16_len(text: str) -> int:
+    """Length as Telegram counts it (emoji and other non-BMP chars count twice)"""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _truncate(text: str, limit: int, suffix: str = "...") -> str:
+    """Cut `text` to at most `limit` UTF-16 code units, ending with `suffix`"""
+    if len(text) * 2 <= limit or _utf16_len(text) <= limit:
+        return text
+    cut = (limit - len(suffix)) * 2
+    # "ignore" drops a surrogate pair split by the cut
+    return text.encode("utf-16-le")[:cut].decode("utf-16-le", "ignore") + suffix
+
+
+def _short_caption(text: str, tail: str = READ_MORE, limit: int = CAPTION_LIMIT) -> str:
+    """Excerpt of `text` ending with `tail`, cut once to fit a `limit` caption"""
+    return _truncate(text, limit - _utf16_len(tail), "").rstrip() + tail
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Retry flood control (429, waits `retry_after`) and Telegram server errors.
+
+    Rejected requests (bad HTML, caption too long, wrong chat) fail at once.
+    Network errors are not retried either: the message may have been posted.
+    """
+    return isinstance(exc, (TelegramRetryAfter, TelegramServerError))
+
+
+class _ImageCache:
+    """
+    Bounded LRU of recently downloaded image bytes, keyed by URL.
+
+    Retries and re-announcements of the same article reuse the bytes
+    instead of downloading the image again. Entries expire after `ttl`
+    seconds so a replaced image is eventually picked up.
+    """
+
+    def __init__(
+        self, maxsize: int = 32, max_bytes: int = 64 * 1024 * 1024, ttl: float = 600.0
+    ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._size = 0
+
+    def get(self, url: str) -> Optional[bytes]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl:
+            self._pop(url)
+            return None
+        self._entries.move_to_end(url)
+        return entry[1]
+
+    def put(self, url: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        self._pop(url)
+        self._entries[url] = (time.monotonic(), data)
+        self._size += len(data)
+        while len(self._entries) > self.maxsize or self._size > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+
+    def _pop(self, url: str):
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class _BotSession(AiohttpSession):
+    """
+    aiogram session with a TCPConnector tuned for the Bot API.
+
+    Every request goes to one host (api.telegram.org), so connections are
+    kept alive and reused instead of paying a TLS handshake per call.
+    aiogram only exposes `limit`, so the aiohttp session is built here
+    through the public `create_session` hook.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 30):
+        super().__init__(limit=limit)
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._client_session: Optional[ClientSession] = None
+
+    async def create_session(self) -> ClientSession:
+        if self._client_session is None or self._client_session.closed:
+            self._client_session = ClientSession(
+                connector=TCPConnector(
+                    ssl=ssl.create_default_context(cafile=certifi.where()),
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                headers={"User-Agent": f"aiogram/{aiogram.__version__}"},
+            )
+        return self._client_session
+
+    async def close(self):
+        if self._client_session is not None and not self._client_session.closed:
+            await self._client_session.close()
+            # Give the underlying SSL connections a moment to close
+            await asyncio.sleep(0.25)
+        await super().close()
+
+
 class TelegramPublisher:
     """
     Telegram Channel Publisher
@@ -46,27 +184,109 @@ class TelegramPublisher:
     Uses aiogram for async Telegram Bot API access.
     """
 
-    def __init__(self, config: ConfigManager):
+    # Some image hosts refuse requests without a browser User-Agent
+    IMAGE_FETCH_HEADERS = {"User-Agent": "Mozilla/5.0"}
+    # Telegram's upload limit for photos
+    MAX_PHOTO_BYTES = 10 * 1024 * 1024
+    # String photos/documents with these prefixes are remote URLs
+    _URL_SCHEMES = ("http://", "https://")
+    # Bot API connection pool (all requests go to api.telegram.org)
+    BOT_CONNECTION_LIMIT = 100
+    BOT_CONNECTIONS_PER_HOST = 30
+
+    def __init__(
+        self, config: ConfigManager, client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Telegram Publisher
 
         Args:
             config: ConfigManager instance
+            client: Optional HTTP client for image downloads (defaults to the
+                shared publisher client)
         """
         self.config = config
         self._bot: Optional[Bot] = None
+        self._http_client: Optional[httpx.AsyncClient] = client
+        self._images = _ImageCache()
+
+        # Settings derived from config, re-derived only when it is (re)loaded
+        self._config_snapshot = None
+        self._configured = False
+        self._channel_id = ""
+        self._brand_hashtag = ""
+        self._trusted_image_hosts: frozenset = frozenset()
+        self._sync_config()
 
     def _get_bot(self) -> Bot:
-        """Get or create bot instance"""
+        """Get or create bot instance (one pooled aiohttp session per publisher)"""
         if self._bot is None:
-            self._bot = Bot(token=self.config.app_config.telegram.bot_token)
+            session = _BotSession(
+                limit=self.BOT_CONNECTION_LIMIT,
+                limit_per_host=self.BOT_CONNECTIONS_PER_HOST,
+            )
+            self._bot = Bot(
+                token=self.config.app_config.telegram.bot_token, session=session
+            )
         return self._bot
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get HTTP client (injected, or the shared pooled client)"""
+        return self._http_client or get_shared_client()
+
     async def close(self):
-        """Close bot session"""
+        """Close bot session (HTTP clients are shared/owned by the caller)"""
         if self._bot:
             await self._bot.session.close()
             self._bot = None
+        self._http_client = None
+
+    async def _download_image(self, url: str, filename: str) -> BufferedInputFile:
+        """
+        Download an image so it can be uploaded to Telegram directly
+
+        More reliable than URLInputFile (Telegram fetching remote URLs can fail).
+        Uses the pooled client, so repeated images reuse open connections, and
+        recently downloaded images are served from memory.
+
+        Raises:
+            httpx.HTTPError, ValueError: if the URL doesn't serve an image
+                Telegram would accept (wrong type, or over MAX_PHOTO_BYTES)
+        """
+        data = self._images.get(url)
+        if data is not None:
+            return BufferedInputFile(data, filename=filename)
+
+        client = await self._get_client()
+        limit = self.MAX_PHOTO_BYTES
+        async with client.stream(
+            "GET",
+            url,
+            headers=self.IMAGE_FETCH_HEADERS,
+            follow_redirects=True,
+            timeout=30.0,
+        ) as r:
+            r.raise_for_status()
+            content_type = r.headers.get("content-type", "")
+            # MIME types are lowercase in practice; only lowercase odd ones
+            if not (
+                content_type.startswith("image/")
+                or content_type.lower().startswith("image/")
+            ):
+                raise ValueError(f"Non-image content-type: {content_type}")
+
+            # Reject oversized images before (or while) reading them
+            if int(r.headers.get("content-length") or 0) > limit:
+                raise ValueError(f"Image larger than {limit} bytes")
+            buf = bytearray()
+            async for chunk in r.aiter_bytes(64 * 1024):
+                buf.extend(chunk)
+                if len(buf) > limit:
+                    raise ValueError(f"Image larger than {limit} bytes")
+
+        data = bytes(buf)
+        self._images.put(url, data)
+        return BufferedInputFile(data, filename=filename)
 
     @property
     def telegram_config(self):
@@ -76,19 +296,48 @@ class TelegramPublisher:
     @property
     def channel_id(self) -> str:
         """Get channel ID"""
-        return self.telegram_config.channel_id
+        self._sync_config()
+        return self._channel_id
 
     def is_configured(self) -> bool:
         """Check if Telegram is properly configured"""
-        return self.config.is_configured("telegram")
+        self._sync_config()
+        return self._configured
+
+    def _sync_config(self):
+        """Refresh cached settings if the AppConfig instance changed (reload)"""
+        app_config = self.config.app_config
+        if app_config is self._config_snapshot:
+            return
+
+        telegram = app_config.telegram
+        self._config_snapshot = app_config
+        self._configured = self.config.is_configured("telegram")
+        self._channel_id = telegram.channel_id if telegram else ""
+        self._brand_hashtag = "#" + app_config.prompts.brand_name.replace(" ", "_")
+        self._trusted_image_hosts = frozenset(
+            host.lower() for host in (telegram.trusted_image_hosts if telegram else [])
+        )
+
+    async def _photo_input(self, url: str, filename: str) -> Union[str, InputFile]:
+        """
+        Pick how Telegram gets a remote image.
+
+        Trusted hosts are passed as the bare URL so Telegram's servers fetch
+        the image (one hop). Others are downloaded and re-uploaded, falling
+        back to URLInputFile if the download fails.
+        """
+        if (urlsplit(url).hostname or "") in self._trusted_image_hosts:
+            return url
+        try:
+            return await self._download_image(url, filename=filename)
+        except Exception:
+            return URLInputFile(url)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PUBLISHING
     # ═══════════════════════════════════════════════════════════════════════════
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=30)
-    )
     async def publish_text(
         self,
         text: str,
@@ -115,28 +364,28 @@ class TelegramPublisher:
         bot = self._get_bot()
 
         try:
-            # Ensure text is within limits (4096 chars)
-            if len(text) > 4096:
-                text = text[:4090] + "..."
-
-            message = await bot.send_message(
-                chat_id=self.channel_id,
-                text=text,
-                parse_mode=parse_mode,
-                disable_web_page_preview=disable_preview,
-                disable_notification=disable_notification,
+            # Ensure text is within limits
+            text = _truncate(text, MESSAGE_LIMIT)
+
+            message = await with_retries(
+                lambda: bot.send_message(
+                    chat_id=self._channel_id,
+                    text=text,
+                    parse_mode=parse_mode,
+                    disable_web_page_preview=disable_preview,
+                    disable_notification=disable_notification,
+                ),
+                _is_transient,
+                base=2.0,
             )
 
-            logger.info(f"✅ Published to Telegram: message_id={message.message_id}")
+            logger.info("✅ Published to Telegram: message_id=%s", message.message_id)
             return message.message_id
 
         except Exception as e:
-            logger.error(f"Telegram publish failed: {e}")
+            logger.error("Telegram publish failed: %s", e)
             return None
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=30)
-    )
     async def publish_media_group(
         self,
         text: str,
@@ -160,32 +409,18 @@ class TelegramPublisher:
 
         bot = self._get_bot()
 
-        # Caption limit for media is 1024 chars. Preserve full CTA by follow-up if needed.
-        if len(text) <= 1024:
+        # Caption limit for media is 1024. Preserve full CTA by follow-up if needed.
+        if _utf16_len(text) <= CAPTION_LIMIT:
             caption = text
             follow_up = None
         else:
-            caption = text[:900].rstrip() + "\n\n⬇️ <b>التفاصيل والروابط بالأسفل</b>"
+            caption = _short_caption(text)
             follow_up = text
 
         media: List[InputMediaPhoto] = []
         try:
             for i, url in enumerate(urls):
-                # Prefer downloading bytes for reliability, fallback to URLInputFile.
-                try:
-                    async with httpx.AsyncClient(
-                        timeout=30.0, follow_redirects=True
-                    ) as client:
-                        r = await client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                        r.raise_for_status()
-                        content_type = (r.headers.get("content-type") or "").lower()
-                        if "image" not in content_type:
-                            raise ValueError(f"Non-image content-type: {content_type}")
-                        photo_input = BufferedInputFile(
-                            r.content, filename=f"image_{i+1}.jpg"
-                        )
-                except Exception:
-                    photo_input = URLInputFile(url)
+                photo_input = await self._photo_input(url, f"image_{i+1}.jpg")
 
                 if i == 0:
                     media.append(
@@ -196,15 +431,21 @@ class TelegramPublisher:
                 else:
                     media.append(InputMediaPhoto(media=photo_input))
 
-            messages = await bot.send_media_group(
-                chat_id=self.channel_id,
-                media=media,
-                disable_notification=disable_notification,
+            messages = await with_retries(
+                lambda: bot.send_media_group(
+                    chat_id=self._channel_id,
+                    media=media,
+                    disable_notification=disable_notification,
+                ),
+                _is_transient,
+                base=2.0,
             )
 
             first_id = messages[0].message_id if messages else None
             logger.info(
-                f"✅ Published media group to Telegram: message_id={first_id} photos={len(media)}"
+                "✅ Published media group to Telegram: message_id=%s photos=%d",
+                first_id,
+                len(media),
             )
 
             if follow_up:
@@ -215,7 +456,7 @@ class TelegramPublisher:
             return first_id
 
         except Exception as e:
-            logger.error(f"Telegram media group publish failed: {e}")
+            logger.error("Telegram media group publish failed: %s", e)
             # Fallback to single photo if possible, then text.
             try:
                 return await self.publish_photo(
@@ -229,9 +470,6 @@ class TelegramPublisher:
                     text, parse_mode, disable_notification=disable_notification
                 )
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=30)
-    )
     async def publish_photo(
         self,
         text: str,
@@ -255,68 +493,61 @@ class TelegramPublisher:
             logger.error("Telegram not configured")
             return None
 
+        try:
+            return await self._send_photo(
+                text, photo, parse_mode, disable_notification=disable_notification
+            )
+        except Exception as e:
+            logger.error("Telegram photo publish failed: %s", e)
+            # Fallback to text only
+            logger.info("Falling back to text-only post")
+            return await self.publish_text(
+                text, parse_mode, disable_notification=disable_notification
+            )
+
+    async def _send_photo(
+        self,
+        text: str,
+        photo: Union[str, Path, bytes],
+        parse_mode: ParseMode,
+        disable_notification: bool = False,
+    ) -> int:
+        """Send a captioned photo (no fallback); raises on failure"""
         bot = self._get_bot()
 
-        try:
-            # Ensure caption is within limits (1024 chars)
-            if len(text) > 1024:
-                text = text[:1020] + "..."
-
-            # Prepare photo input
-            if isinstance(photo, str):
-                if photo.startswith(("http://", "https://")):
-                    # More reliable than URLInputFile (Telegram fetching remote URLs can fail).
-                    try:
-                        async with httpx.AsyncClient(
-                            timeout=30.0, follow_redirects=True
-                        ) as client:
-                            r = await client.get(
-                                photo, headers={"User-Agent": "Mozilla/5.0"}
-                            )
-                            r.raise_for_status()
-                            content_type = (r.headers.get("content-type") or "").lower()
-                            if "image" not in content_type:
-                                raise ValueError(
-                                    f"Non-image content-type: {content_type}"
-                                )
-                            photo_input = BufferedInputFile(
-                                r.content, filename="image.jpg"
-                            )
-                    except Exception:
-                        photo_input = URLInputFile(photo)
-                else:
-                    photo_input = FSInputFile(photo)
-            elif isinstance(photo, Path):
-                photo_input = FSInputFile(str(photo))
-            elif isinstance(photo, bytes):
-                photo_input = BufferedInputFile(photo, filename="image.jpg")
+        # Ensure caption is within limits
+        text = _truncate(text, CAPTION_LIMIT)
+
+        # Prepare photo input
+        if isinstance(photo, str):
+            if photo.startswith(self._URL_SCHEMES):
+                photo_input = await self._photo_input(photo, "image.jpg")
             else:
-                raise ValueError(f"Invalid photo type: {type(photo)}")
+                photo_input = FSInputFile(photo)
+        elif isinstance(photo, Path):
+            photo_input = FSInputFile(str(photo))
+        elif isinstance(photo, bytes):
+            photo_input = BufferedInputFile(photo, filename="image.jpg")
+        else:
+            raise ValueError(f"Invalid photo type: {type(photo)}")
 
-            message = await bot.send_photo(
-                chat_id=self.channel_id,
+        message = await with_retries(
+            lambda: bot.send_photo(
+                chat_id=self._channel_id,
                 photo=photo_input,
                 caption=text,
                 parse_mode=parse_mode,
                 disable_notification=disable_notification,
-            )
-
-            logger.info(
-                f"✅ Published photo to Telegram: message_id={message.message_id}"
-            )
-            return message.message_id
+            ),
+            _is_transient,
+            base=2.0,
+        )
 
-        except Exception as e:
-            logger.error(f"Telegram photo publish failed: {e}")
-            # Fallback to text only
-            logger.info("Falling back to text-only post")
-            return await self.publish_text(
-                text, parse_mode, disable_notification=disable_notification
-            )
+        logger.info(
+            "✅ Published photo to Telegram: message_id=%s", message.message_id
+        )
+        return message.message_id
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=30)
-    )
     async def publish_document(
         self,
         caption: str,
@@ -343,7 +574,7 @@ class TelegramPublisher:
 
         try:
             if isinstance(document, str):
-                if document.startswith(("http://", "https://")):
+                if document.startswith(self._URL_SCHEMES):
                     doc_input = URLInputFile(document)
                 else:
                     doc_input = FSInputFile(document)
@@ -354,17 +585,21 @@ class TelegramPublisher:
             else:
                 raise ValueError(f"Invalid document type: {type(document)}")
 
-            message = await bot.send_document(
-                chat_id=self.channel_id,
-                document=doc_input,
-                caption=caption[:1024] if len(caption) > 1024 else caption,
-                parse_mode=parse_mode,
+            message = await with_retries(
+                lambda: bot.send_document(
+                    chat_id=self._channel_id,
+                    document=doc_input,
+                    caption=_truncate(caption, CAPTION_LIMIT, ""),
+                    parse_mode=parse_mode,
+                ),
+                _is_transient,
+                base=2.0,
             )
 
             return message.message_id
 
         except Exception as e:
-            logger.error(f"Document publish failed: {e}")
+            logger.error("Document publish failed: %s", e)
             return None
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -405,12 +640,24 @@ class TelegramPublisher:
             return await self.publish_text(text, parse_mode)
 
         # Telegram caption limit is 1024; preserve the full CTA by sending a follow-up.
-        if len(text) <= 1024:
+        if _utf16_len(text) <= CAPTION_LIMIT:
             return await self.publish_photo(text, image_url, parse_mode)
 
-        short_caption = text[:900].rstrip() + "\n\n⬇️ <b>التفاصيل والروابط بالأسفل</b>"
+        if not self.is_configured():
+            logger.error("Telegram not configured")
+            return None
+
+        short_caption = _short_caption(text)
+
+        # Photo then full text, in that order: sent concurrently, the text could
+        # land above the "details below" photo in the channel
+        try:
+            first_id = await self._send_photo(short_caption, image_url, parse_mode)
+        except Exception as e:
+            logger.error("Telegram photo publish failed: %s", e)
+            # The full text alone carries everything; don't post the excerpt too
+            return await self.publish_text(text, parse_mode)
 
-        first_id = await self.publish_photo(short_caption, image_url, parse_mode)
         # Send full text as separate message (4096 limit handled in publish_text)
         await self.publish_text(text, parse_mode)
         return first_id
@@ -436,19 +683,21 @@ class TelegramPublisher:
         Returns:
             Message ID if successful
         """
+        escape = self._escape_html
+
         # Build formatted message
-        message = f"📝 <b>{self._escape_html(title)}</b>\n\n"
-        message += f"{self._escape_html(summary)}\n\n"
+        parts = [f"📝 <b>{escape(title)}</b>\n\n", f"{escape(summary)}\n\n"]
 
         if blogger_url:
-            message += f'📖 <a href="{blogger_url}">اقرأ المقال كامل</a>\n'
+            parts.append(f'📖 <a href="{blogger_url}">اقرأ المقال كامل</a>\n')
 
         if devto_url:
-            message += f'🇬🇧 <a href="{devto_url}">English Version</a>\n'
+            parts.append(f'🇬🇧 <a href="{devto_url}">English Version</a>\n')
 
-        message += f"\n#{self.config.app_config.prompts.brand_name.replace(' ', '_')}"
+        self._sync_config()
+        parts.append(f"\n{self._brand_hashtag}")
 
-        return await self.publish_post(message, image_url)
+        return await self.publish_post("".join(parts), image_url)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # CHANNEL MANAGEMENT
@@ -467,7 +716,10 @@ class TelegramPublisher:
         bot = self._get_bot()
 
         try:
-            chat = await bot.get_chat(self.channel_id)
+            # Independent lookups: one round-trip instead of two
+            chat, member_count = await asyncio.gather(
+                bot.get_chat(self._channel_id), self._get_member_count(bot)
+            )
 
             return {
                 "id": chat.id,
@@ -475,19 +727,18 @@ class TelegramPublisher:
                 "username": chat.username,
                 "type": chat.type,
                 "description": chat.description,
-                "member_count": await self._get_member_count(),
+                "member_count": member_count,
             }
         except Exception as e:
-            logger.error(f"Failed to get channel info: {e}")
+            logger.error("Failed to get channel info: %s", e)
             return None
 
-    async def _get_member_count(self) -> int:
-        """Get channel member count"""
+    async def _get_member_count(self, bot: Bot) -> int:
+        """Get channel member count (0 if Telegram can't tell us)"""
         try:
-            bot = self._get_bot()
-            count = await bot.get_chat_member_count(self.channel_id)
-            return count
-        except:
+            return await bot.get_chat_member_count(self._channel_id)
+        except TelegramAPIError as e:
+            logger.debug("Failed to get member count: %s", e)
             return 0
 
     async def delete_message(self, message_id: int) -> bool:
@@ -506,10 +757,10 @@ class TelegramPublisher:
         bot = self._get_bot()
 
         try:
-            await bot.delete_message(self.channel_id, message_id)
+            await bot.delete_message(self._channel_id, message_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete message: {e}")
+            logger.error("Failed to delete message: %s", e)
             return False
 
     async def edit_message(
@@ -533,14 +784,14 @@ class TelegramPublisher:
 
         try:
             await bot.edit_message_text(
-                chat_id=self.channel_id,
+                chat_id=self._channel_id,
                 message_id=message_id,
                 text=new_text,
                 parse_mode=parse_mode,
             )
             return True
         except Exception as e:
-            logger.error(f"Failed to edit message: {e}")
+            logger.error("Failed to edit message: %s", e)
             return False
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -555,33 +806,45 @@ class TelegramPublisher:
             message: Notification message
         """
         bot = self._get_bot()
-
-        for admin_id in self.telegram_config.admin_user_ids:
-            try:
-                await bot.send_message(
-                    chat_id=admin_id,
-                    text=f"🔔 <b>ContentOrbit Alert</b>\n\n{message}",
-                    parse_mode=ParseMode.HTML,
-                )
-            except Exception as e:
-                logger.error(f"Failed to notify admin {admin_id}: {e}")
+        admin_ids = self.telegram_config.admin_user_ids
+        text = f"🔔 <b>ContentOrbit Alert</b>\n\n{message}"
+
+        # All admins at once over the bot's session, not one round-trip each
+        results = await asyncio.gather(
+            *(
+                bot.send_message(chat_id=admin_id, text=text, parse_mode=ParseMode.HTML)
+                for admin_id in admin_ids
+            ),
+            return_exceptions=True,
+        )
+        for admin_id, result in zip(admin_ids, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to notify admin %s: %s", admin_id, result)
 
     async def notify_admins_document(
         self, caption: str, document_bytes: bytes, filename: str = "drafts.txt"
     ) -> None:
         """Send a document to all admins (useful for long drafts)."""
         bot = self._get_bot()
+        admin_ids = self.telegram_config.admin_user_ids
         doc = BufferedInputFile(document_bytes, filename=filename)
-        for admin_id in self.telegram_config.admin_user_ids:
-            try:
-                await bot.send_document(
+        results = await asyncio.gather(
+            *(
+                bot.send_document(
                     chat_id=admin_id,
                     document=doc,
-                    caption=caption[:1024],
+                    caption=_truncate(caption, CAPTION_LIMIT, ""),
                     parse_mode=ParseMode.HTML,
                 )
-            except Exception as e:
-                logger.error(f"Failed to send document to admin {admin_id}: {e}")
+                for admin_id in admin_ids
+            ),
+            return_exceptions=True,
+        )
+        for admin_id, result in zip(admin_ids, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to send document to admin %s: %s", admin_id, result
+                )
 
     async def send_error_alert(self, error: str, component: str = "system") -> None:
         """
@@ -601,13 +864,8 @@ class TelegramPublisher:
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters"""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-        )
+        """Escape HTML special characters (stdlib html.escape)"""
+        return html.escape(text)
 
     def format_post(
         self,
@@ -628,15 +886,16 @@ class TelegramPublisher:
         Returns:
             Formatted HTML post
         """
-        post = f"<b>{self._escape_html(title)}</b>\n\n"
-        post += f"{self._escape_html(body)}\n"
+        escape = self._escape_html
+        parts = [f"<b>{escape(title)}</b>\n\n", f"{escape(body)}\n"]
 
         if links:
-            post += "\n"
-            for label, url in links.items():
-                post += f'🔗 <a href="{url}">{label}</a>\n'
+            parts.append("\n")
+            parts.extend(
+                f'🔗 <a href="{url}">{label}</a>\n' for label, url in links.items()
+            )
 
         if hashtags:
-            post += "\n" + " ".join(f"#{tag}" for tag in hashtags)
+            parts.append("\n" + " ".join(f"#{tag}" for tag in hashtags))
 
-        return post
+        return "".join(parts)
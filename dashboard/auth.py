@@ -6,6 +6,7 @@ Simple password-based authentication for dashboard access.
 
 import streamlit as st
 import hashlib
+import hmac
 from typing import Optional
 
 
@@ -14,17 +15,25 @@ def hash_password(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()
 
 
+@st.cache_data(show_spinner=False, max_entries=1)
+def _password_digest(password: str) -> str:
+    """Digest of the configured password, computed once instead of per rerun"""
+    return hash_password(password)
+
+
 def check_password(correct_password: str) -> bool:
     """
     Check if user has entered correct password.
     Returns True if authenticated.
     """
+    correct_hash = _password_digest(correct_password)
 
     def password_entered():
         """Checks whether password entered is correct"""
         entered = st.session_state.get("password", "")
         st.session_state["login_attempted"] = True
-        if entered == correct_password:
+        # Compare fixed-length digests in constant time (no timing leak)
+        if hmac.compare_digest(hash_password(entered), correct_hash):
             st.session_state["authenticated"] = True
             st.session_state["login_error"] = False
             # Don't store password
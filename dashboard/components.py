@@ -5,8 +5,12 @@ Premium reusable UI components with modern design.
 """
 
 import streamlit as st
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from html import escape
+from itertools import islice
+from typing import Optional, Dict, Any, Iterable, List
 
 
 def render_header():
@@ -34,18 +38,7 @@ def render_sidebar_nav():
     pass
 
 
-def render_metric_card(
-    title: str, value: Any, delta: Optional[str] = None, icon: str = "📊"
-):
-    """Render a premium styled metric card"""
-    delta_html = (
-        f'<p style="color: #10b981; font-size: 0.875rem; margin: 0;">{delta}</p>'
-        if delta
-        else ""
-    )
-
-    st.markdown(
-        f"""
+_METRIC_CARD_TEMPLATE = """
     <div style="
         background: linear-gradient(135deg, rgba(99, 102, 241, 0.3) 0%, rgba(236, 72, 153, 0.3) 100%);
         backdrop-filter: blur(10px);
@@ -59,7 +52,23 @@ def render_metric_card(
         <h2 style="font-size: 2.5rem; margin: 0.5rem 0; color: white; font-weight: 700;">{value}</h2>
         {delta_html}
     </div>
-    """,
+    """
+
+
+def render_metric_card(
+    title: str, value: Any, delta: Optional[str] = None, icon: str = "📊"
+):
+    """Render a premium styled metric card"""
+    delta_html = (
+        f'<p style="color: #10b981; font-size: 0.875rem; margin: 0;">{delta}</p>'
+        if delta
+        else ""
+    )
+
+    st.markdown(
+        _METRIC_CARD_TEMPLATE.format(
+            icon=icon, title=title, value=value, delta_html=delta_html
+        ),
         unsafe_allow_html=True,
     )
 
@@ -80,21 +89,14 @@ def render_status_badge(is_running: bool):
             border-radius: 25px;
             font-weight: 600;
         ">
-            <span style="
+            <span class="co-pulse-dot" style="
                 width: 10px;
                 height: 10px;
                 background: #10b981;
                 border-radius: 50%;
-                animation: pulse 2s infinite;
             "></span>
             Running
         </div>
-        <style>
-            @keyframes pulse {
-                0%, 100% { opacity: 1; transform: scale(1); }
-                50% { opacity: 0.5; transform: scale(1.2); }
-            }
-        </style>
         """,
             unsafe_allow_html=True,
         )
@@ -126,77 +128,66 @@ def render_status_badge(is_running: bool):
 
 
 def render_platform_status(platforms: Dict[str, bool]):
-    """Render platform configuration status cards"""
-    cols = st.columns(len(platforms))
-
-    for col, (platform, is_configured) in zip(cols, platforms.items()):
-        with col:
-            icon = "✅" if is_configured else "❌"
-            border_color = "#10b981" if is_configured else "#ef4444"
-            bg_color = (
-                "rgba(16, 185, 129, 0.1)" if is_configured else "rgba(239, 68, 68, 0.1)"
-            )
-
-            st.markdown(
-                f"""
-            <div style="
-                text-align: center;
-                padding: 1.25rem;
-                background: {bg_color};
-                border: 2px solid {border_color};
-                border-radius: 16px;
-                transition: all 0.3s ease;
-            ">
-                <span style="font-size: 1.5rem;">{icon}</span>
-                <p style="margin: 0.5rem 0 0 0; color: white; font-weight: 600;">
-                    {platform}
-                </p>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+    """Render platform configuration status cards as one grid element"""
+    cards_html = "".join(
+        _platform_card_html(platform, is_configured)
+        for platform, is_configured in platforms.items()
+    )
+    # auto-fit wraps the cards on narrow (mobile) screens like st.columns did
+    st.markdown(
+        f"""
+    <div style="
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
+        gap: 1rem;
+    ">{cards_html}
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
 
 
-def render_log_entry(log):
-    """Render a single log entry - handles both dict and Pydantic model"""
-    # Handle both dict and Pydantic model
-    if hasattr(log, "level"):
-        level = str(log.level).lower()
-        timestamp = log.timestamp
-        component = getattr(log, "component", "system")
-        action = getattr(log, "action", "")
-        message = getattr(log, "message", "")
-    else:
-        level = str(log.get("level", "info")).lower()
-        timestamp = log.get("timestamp", "")
-        component = log.get("component", "system")
-        action = log.get("action", "")
-        message = log.get("message", "")
+def _platform_card_html(platform: str, is_configured: bool) -> str:
+    """Build the HTML status card for one platform"""
+    icon = "✅" if is_configured else "❌"
+    border_color = "#10b981" if is_configured else "#ef4444"
+    bg_color = "rgba(16, 185, 129, 0.1)" if is_configured else "rgba(239, 68, 68, 0.1)"
 
-    # Remove 'loglevel.' prefix if present
-    if level.startswith("loglevel."):
-        level = level.replace("loglevel.", "")
+    return f"""
+        <div style="
+            text-align: center;
+            padding: 1.25rem;
+            background: {bg_color};
+            border: 2px solid {border_color};
+            border-radius: 16px;
+            transition: all 0.3s ease;
+        ">
+            <span style="font-size: 1.5rem;">{icon}</span>
+            <p style="margin: 0.5rem 0 0 0; color: white; font-weight: 600;">
+                {platform}
+            </p>
+        </div>"""
 
-    level_styles = {
-        "debug": {"color": "#64748b", "bg": "rgba(100, 116, 139, 0.1)", "icon": "🔍"},
-        "info": {"color": "#6366f1", "bg": "rgba(99, 102, 241, 0.1)", "icon": "ℹ️"},
-        "warning": {"color": "#f59e0b", "bg": "rgba(245, 158, 11, 0.1)", "icon": "⚠️"},
-        "error": {"color": "#ef4444", "bg": "rgba(239, 68, 68, 0.1)", "icon": "❌"},
-        "critical": {"color": "#dc2626", "bg": "rgba(220, 38, 38, 0.1)", "icon": "🚨"},
-        "success": {"color": "#10b981", "bg": "rgba(16, 185, 129, 0.1)", "icon": "✅"},
-    }
 
-    style = level_styles.get(level, level_styles["info"])
+@lru_cache(maxsize=2048)
+def _escape_cached(text: str) -> str:
+    """HTML-escape short strings that repeat a lot (components, actions, levels)"""
+    return escape(text)
 
-    if isinstance(timestamp, datetime):
-        timestamp_str = timestamp.strftime("%H:%M:%S")
-    elif timestamp:
-        timestamp_str = str(timestamp)[:8]
-    else:
-        timestamp_str = "--:--:--"
 
-    st.markdown(
-        f"""
+_LOG_LEVEL_STYLES = {
+    "debug": {"color": "#64748b", "bg": "rgba(100, 116, 139, 0.1)", "icon": "🔍"},
+    "info": {"color": "#6366f1", "bg": "rgba(99, 102, 241, 0.1)", "icon": "ℹ️"},
+    "warning": {"color": "#f59e0b", "bg": "rgba(245, 158, 11, 0.1)", "icon": "⚠️"},
+    "error": {"color": "#ef4444", "bg": "rgba(239, 68, 68, 0.1)", "icon": "❌"},
+    "critical": {"color": "#dc2626", "bg": "rgba(220, 38, 38, 0.1)", "icon": "🚨"},
+    "success": {"color": "#10b981", "bg": "rgba(16, 185, 129, 0.1)", "icon": "✅"},
+}
+
+
+def _log_level_html(level: str, style: Dict[str, str]) -> str:
+    """Opening HTML of a log card: everything that depends only on the level"""
+    return f"""
     <div style="
         background: {style['bg']};
         border-left: 4px solid {style['color']};
@@ -215,21 +206,106 @@ def render_log_entry(log):
                     font-size: 0.75rem;
                     font-weight: 600;
                     text-transform: uppercase;
-                ">{level}</span>
-                <span style="color: #a5b4fc; font-weight: 500;">[{component}]</span>
-                {f'<span style="color: #64748b;">{action}</span>' if action else ''}
+                ">{level}</span>"""
+
+
+# Pre-rendered card openers per level; entries only fill in the template
+_LOG_LEVEL_HTML = {
+    level: _log_level_html(level, style) for level, style in _LOG_LEVEL_STYLES.items()
+}
+
+_LOG_ENTRY_TEMPLATE = """
+                <span style="color: #a5b4fc; font-weight: 500;">[{component}]</span>{action}
             </div>
-            <span style="color: #64748b; font-size: 0.75rem; font-family: monospace;">{timestamp_str}</span>
+            <span style="color: #64748b; font-size: 0.75rem; font-family: monospace;">{timestamp}</span>
         </div>
         <p style="margin: 0.75rem 0 0 0; color: #e2e8f0; font-size: 0.9rem;">{message}</p>
     </div>
-    """,
+    """
+
+
+def render_log_entry(log):
+    """Render a single log entry - handles both dict and Pydantic model"""
+    st.markdown(_log_entry_html(log), unsafe_allow_html=True)
+
+
+def render_log_entries(logs: Iterable[Any], limit: int = 200):
+    """Render up to `limit` log entries with a single st.markdown call"""
+    st.markdown(
+        "".join(_log_entry_html(log) for log in islice(logs, limit)),
         unsafe_allow_html=True,
     )
 
 
+@lru_cache(maxsize=64)
+def _normalize_level(level: Any) -> str:
+    """Map a LogLevel member or level string to its lowercase name (memoized)"""
+    name = str(level).lower()
+    # Remove 'loglevel.' prefix if present
+    if name.startswith("loglevel."):
+        name = name[len("loglevel.") :]
+    return name
+
+
+def _log_entry_html(log) -> str:
+    """Build the HTML card for one log entry"""
+    # Handle both dict and Pydantic model
+    if hasattr(log, "level"):
+        level = _normalize_level(log.level)
+        timestamp = log.timestamp
+        component = getattr(log, "component", "system")
+        action = getattr(log, "action", "")
+        message = getattr(log, "message", "")
+    else:
+        level = _normalize_level(log.get("level", "info"))
+        timestamp = log.get("timestamp", "")
+        component = log.get("component", "system")
+        action = log.get("action", "")
+        message = log.get("message", "")
+
+    prefix = _LOG_LEVEL_HTML.get(level)
+    if prefix is None:
+        prefix = _log_level_html(_escape_cached(level), _LOG_LEVEL_STYLES["info"])
+
+    if isinstance(timestamp, datetime):
+        timestamp_str = timestamp.strftime("%H:%M:%S")
+    elif timestamp:
+        timestamp_str = escape(str(timestamp)[:8])
+    else:
+        timestamp_str = "--:--:--"
+
+    if action:
+        action = f'<span style="color: #64748b;">{_escape_cached(str(action))}</span>'
+
+    # Log text is data, not markup: escape it so cards can't break the page
+    return prefix + _LOG_ENTRY_TEMPLATE.format(
+        component=_escape_cached(str(component)),
+        action=action or "",
+        timestamp=timestamp_str,
+        message=escape(str(message)),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _display_url(url: str) -> str:
+    """Feed URL shortened to 50 chars and HTML-escaped for a card"""
+    return escape(url) if len(url) <= 50 else escape(url[:50]) + "..."
+
+
 def render_feed_card(feed):
     """Render an RSS feed card - handles both dict and Pydantic model"""
+    st.markdown(_feed_card_html(feed), unsafe_allow_html=True)
+
+
+def render_feed_cards(feeds: List[Any]):
+    """Render many RSS feed cards with a single st.markdown call"""
+    st.markdown(
+        "".join(_feed_card_html(feed) for feed in feeds), unsafe_allow_html=True
+    )
+
+
+def _feed_card_html(feed) -> str:
+    """Build the HTML card for one RSS feed"""
     # Handle both dict and Pydantic model
     if hasattr(feed, "name"):
         name = feed.name
@@ -248,8 +324,7 @@ def render_feed_card(feed):
     status_text = "Active" if enabled else "Disabled"
     status_icon = "✅" if enabled else "⏸️"
 
-    st.markdown(
-        f"""
+    return f"""
     <div style="
         background: rgba(255, 255, 255, 0.05);
         border: 2px solid {border_color};
@@ -260,9 +335,9 @@ def render_feed_card(feed):
     ">
         <div style="display: flex; justify-content: space-between; align-items: start; flex-wrap: wrap; gap: 0.5rem;">
             <div style="flex: 1; min-width: 200px;">
-                <h4 style="margin: 0; color: white; font-weight: 600;">{name}</h4>
+                <h4 style="margin: 0; color: white; font-weight: 600;">{escape(str(name))}</h4>
                 <p style="color: #64748b; font-size: 0.8rem; margin: 0.25rem 0; word-break: break-all;">
-                    {url[:50]}{'...' if len(url) > 50 else ''}
+                    {_display_url(url)}
                 </p>
             </div>
             <div style="display: flex; align-items: center; gap: 0.5rem;">
@@ -273,7 +348,7 @@ def render_feed_card(feed):
                     border-radius: 8px;
                     font-size: 0.75rem;
                     font-weight: 500;
-                ">{category}</span>
+                ">{_escape_cached(str(category))}</span>
                 <span style="
                     background: {border_color}20;
                     color: {border_color};
@@ -285,9 +360,7 @@ def render_feed_card(feed):
             </div>
         </div>
     </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
 
 
 def format_time_ago(dt) -> str:
@@ -304,23 +377,29 @@ def format_time_ago(dt) -> str:
     if not isinstance(dt, datetime):
         return str(dt)
 
-    now = datetime.utcnow()
+    # Naive datetimes are stored in UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return _time_ago_str(int(dt.timestamp() // 60), int(time.time() // 60))
 
-    # Handle timezone-aware datetime
-    if dt.tzinfo is not None:
-        dt = dt.replace(tzinfo=None)
 
-    diff = now - dt
+_EPOCH = datetime(1970, 1, 1)
+_MINUTE = timedelta(minutes=1)
 
-    if diff.days > 30:
-        return dt.strftime("%b %d, %Y")
-    elif diff.days > 0:
-        return f"{diff.days}d ago"
-    elif diff.seconds > 3600:
-        hours = diff.seconds // 3600
-        return f"{hours}h ago"
-    elif diff.seconds > 60:
-        minutes = diff.seconds // 60
+
+@lru_cache(maxsize=4096)
+def _time_ago_str(epoch_minute: int, now_epoch_minute: int) -> str:
+    """Time-ago label at minute granularity (shared by items in the same bucket)"""
+    days, minutes = divmod(now_epoch_minute - epoch_minute, 24 * 60)
+
+    if days > 30:
+        return (_EPOCH + epoch_minute * _MINUTE).strftime("%b %d, %Y")
+    elif days > 0:
+        return f"{days}d ago"
+    elif minutes >= 60:
+        return f"{minutes // 60}h ago"
+    elif minutes > 0:
         return f"{minutes}m ago"
     else:
         return "Just now"
@@ -344,8 +423,8 @@ def render_empty_state(
         text-align: center;
     ">
         <div style="font-size: 3rem; margin-bottom: 1rem;">{icon}</div>
-        <h3 style="color: white; margin-bottom: 0.5rem;">{title}</h3>
-        <p style="color: #a5b4fc; margin: 0;">{description}</p>
+        <h3 style="color: white; margin-bottom: 0.5rem;">{escape(title)}</h3>
+        <p style="color: #a5b4fc; margin: 0;">{escape(description)}</p>
     </div>
     """,
         unsafe_allow_html=True,
@@ -355,13 +434,15 @@ def render_empty_state(
         st.button(action_text, key=action_key, use_container_width=True, type="primary")
 
 
+# Progress bar colors: under 80%, 80-99%, full
+_PROGRESS_COLORS = ("#10b981", "#f59e0b", "#ef4444")
+
+
 def render_progress_bar(value: float, label: str = ""):
     """Render a styled progress bar"""
     percentage = min(max(value * 100, 0), 100)
 
-    color = (
-        "#10b981" if percentage < 80 else "#f59e0b" if percentage < 100 else "#ef4444"
-    )
+    color = _PROGRESS_COLORS[(percentage >= 80) + (percentage >= 100)]
 
     st.markdown(
         f"""
@@ -390,18 +471,7 @@ def render_progress_bar(value: float, label: str = ""):
     )
 
 
-def render_stat_card(
-    icon: str, label: str, value: Any, trend: str = None, trend_positive: bool = True
-):
-    """Render a compact stat card"""
-    trend_html = ""
-    if trend:
-        trend_color = "#10b981" if trend_positive else "#ef4444"
-        trend_icon = "↑" if trend_positive else "↓"
-        trend_html = f'<span style="color: {trend_color}; font-size: 0.75rem;">{trend_icon} {trend}</span>'
-
-    st.markdown(
-        f"""
+_STAT_CARD_TEMPLATE = """
     <div style="
         background: rgba(255, 255, 255, 0.05);
         border: 1px solid rgba(255, 255, 255, 0.1);
@@ -429,6 +499,22 @@ def render_stat_card(
             </div>
         </div>
     </div>
-    """,
+    """
+
+
+def render_stat_card(
+    icon: str, label: str, value: Any, trend: str = None, trend_positive: bool = True
+):
+    """Render a compact stat card"""
+    trend_html = ""
+    if trend:
+        trend_color = "#10b981" if trend_positive else "#ef4444"
+        trend_icon = "↑" if trend_positive else "↓"
+        trend_html = f'<span style="color: {trend_color}; font-size: 0.75rem;">{trend_icon} {trend}</span>'
+
+    st.markdown(
+        _STAT_CARD_TEMPLATE.format(
+            icon=icon, label=label, value=value, trend_html=trend_html
+        ),
         unsafe_allow_html=True,
     )
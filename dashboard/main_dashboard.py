@@ -6,6 +6,7 @@ Premium UI/UX Dashboard with Setup Wizard for Beginners
 
 import streamlit as st
 import os
+from html import escape
 import sys
 from pathlib import Path
 
@@ -13,8 +14,7 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(ROOT_DIR))
 
-from core.config_manager import ConfigManager
-from core.database_manager import DatabaseManager
+from dashboard import views
 from dashboard.auth import check_password, render_logout_button
 
 
@@ -23,8 +23,9 @@ from dashboard.auth import check_password, render_logout_button
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+@st.cache_resource(show_spinner=False)
 def setup_google_credentials():
-    """Restores service_account.json from env vars for cloud deployment"""
+    """Restores service_account.json from env vars (once per process)"""
     import json
 
     # Path relative to project root
@@ -47,9 +48,6 @@ def setup_google_credentials():
             print(f"❌ Failed to restore credentials: {e}")
 
 
-setup_google_credentials()
-
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # PAGE CONFIG
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -66,11 +64,18 @@ st.set_page_config(
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+@st.cache_data(show_spinner=False)
+def _read_css(path: str, mtime: float) -> str:
+    """Read a stylesheet once; `mtime` is part of the key so edits reload it"""
+    with open(path, "r") as f:
+        return f.read()
+
+
 def load_css():
     css_path = Path(__file__).parent / "assets" / "style.css"
     if css_path.exists():
-        with open(css_path, "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        css = _read_css(str(css_path), css_path.stat().st_mtime)
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 
 load_css()
@@ -81,8 +86,10 @@ load_css()
 
 
 # Support both .env (local) and st.secrets (Streamlit Community)
+# cache_resource keeps the value in-process; cache_data would pickle a copy
+@st.cache_resource(show_spinner=False)
 def get_secret(key: str, default: str = ""):
-    """Get secret from either st.secrets or environment"""
+    """Get secret from either st.secrets or environment (once per process)"""
     # Try Streamlit secrets first (Streamlit Community Cloud)
     try:
         return st.secrets.get(key, os.environ.get(key, default))
@@ -96,6 +103,8 @@ DASHBOARD_PASSWORD = get_secret("DASHBOARD_PASSWORD", "admin123")
 if not check_password(DASHBOARD_PASSWORD):
     st.stop()
 
+setup_google_credentials()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # INITIALIZE MANAGERS
@@ -105,6 +114,9 @@ if not check_password(DASHBOARD_PASSWORD):
 @st.cache_resource
 def get_config():
     """Get cached config manager"""
+    # Imported here so the login page renders before the core stack loads
+    from core.config_manager import ConfigManager
+
     try:
         return ConfigManager()
     except Exception as e:
@@ -118,6 +130,8 @@ def get_config():
 @st.cache_resource
 def get_db():
     """Get cached database manager"""
+    from core.database_manager import DatabaseManager
+
     try:
         return DatabaseManager()
     except Exception as e:
@@ -125,6 +139,12 @@ def get_db():
         return None
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def get_stats(_db, db_id: int):
+    """Get system stats, reused across reruns for a few seconds"""
+    return _db.get_stats()
+
+
 config = get_config()
 db = get_db()
 
@@ -133,13 +153,22 @@ db = get_db()
 # SIDEBAR NAVIGATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-with st.sidebar:
-    # Logo/Branding
-    brand_name = config.app_config.brand_name
-    brand_tagline = config.app_config.brand_tagline
 
-    st.markdown(
-        f"""
+# Navigation label -> page renderer in dashboard.views
+PAGES = {
+    "🏠 Home": "render_home_page",
+    "🚀 Setup Guide": "render_setup_guide",
+    "⚙️ Configuration": "render_config_page",
+    "📡 Sources": "render_sources_page",
+    "🤖 Telegram Bot": "render_telegram_bot_page",
+    "📝 Logs": "render_logs_page",
+}
+
+
+@st.cache_data(show_spinner=False)
+def sidebar_brand_html(name: str, tagline: str) -> str:
+    """Sidebar brand block, built once per brand name/tagline"""
+    return f"""
     <div style="text-align: center; padding: 1.5rem 0;">
         <div style="font-size: 3rem; margin-bottom: 0.5rem;">🚀</div>
         <h1 style="
@@ -149,86 +178,77 @@ with st.sidebar:
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             font-weight: 800;
-        ">{brand_name}</h1>
+        ">{escape(name)}</h1>
         <p style="color: #a5b4fc; font-size: 0.875rem; margin-top: 0.5rem;">
-            {brand_tagline}
+            {escape(tagline)}
         </p>
     </div>
-    """,
+    <hr>
+    """
+
+
+with st.sidebar:
+    app_cfg = config.app_config
+
+    # Logo/Branding
+    st.markdown(
+        sidebar_brand_html(app_cfg.brand_name, app_cfg.brand_tagline),
         unsafe_allow_html=True,
     )
 
-    st.markdown("---")
-
     # Navigation
     page = st.radio(
         "Navigation",
-        options=[
-            "🏠 Home",
-            "🚀 Setup Guide",
-            "⚙️ Configuration",
-            "📡 Sources",
-            "🤖 Telegram Bot",
-            "📝 Logs",
-        ],
+        options=list(PAGES),
         label_visibility="collapsed",
     )
 
-    st.markdown("---")
-
     # Quick status
     if db:
-        stats = db.get_stats()
+        stats = get_stats(db, id(db))
     else:
         # Mock stats for view-only mode
         from core.models import SystemStats
 
         stats = SystemStats(
             total_posts=0,
-            active_feeds=len(config.feeds) if config.feeds else 0,
+            active_feeds=len(config.feeds or []),
             is_running=False,
             last_post_time=None,
             last_error_time=None,
         )
 
-    # Safely get max_posts_per_day
-    max_posts = 10  # default
-    if config.app_config.schedule:
-        max_posts = config.app_config.schedule.max_posts_per_day
+    # Safely get max_posts_per_day (default 10)
+    schedule = app_cfg.schedule
+    max_posts = schedule.max_posts_per_day if schedule else 10
 
     if stats.is_running:
-        st.markdown(
-            """
-        <div style="
-            text-align: center;
-            background: rgba(16, 185, 129, 0.2);
-            border: 1px solid #10b981;
-            border-radius: 12px;
-            padding: 0.75rem;
-        ">
-            <span style="color: #10b981; font-weight: 600;">🟢 Bot Running</span>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+        status_html = """
+    <div style="
+        text-align: center;
+        background: rgba(16, 185, 129, 0.2);
+        border: 1px solid #10b981;
+        border-radius: 12px;
+        padding: 0.75rem;
+    ">
+        <span style="color: #10b981; font-weight: 600;">🟢 Bot Running</span>
+    </div>"""
     else:
-        st.markdown(
-            """
-        <div style="
-            text-align: center;
-            background: rgba(239, 68, 68, 0.2);
-            border: 1px solid #ef4444;
-            border-radius: 12px;
-            padding: 0.75rem;
-        ">
-            <span style="color: #ef4444; font-weight: 600;">🔴 Bot Stopped</span>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+        status_html = """
+    <div style="
+        text-align: center;
+        background: rgba(239, 68, 68, 0.2);
+        border: 1px solid #ef4444;
+        border-radius: 12px;
+        padding: 0.75rem;
+    ">
+        <span style="color: #ef4444; font-weight: 600;">🔴 Bot Stopped</span>
+    </div>"""
 
+    # Status, posts counter and dividers as one element
     st.markdown(
         f"""
+    <hr>{status_html}
     <div style="
         text-align: center; 
         margin-top: 0.75rem; 
@@ -244,9 +264,7 @@ with st.sidebar:
         unsafe_allow_html=True,
     )
 
-    st.markdown("---")
-
-    # Logout button
+    # Logout button (draws its own divider)
     render_logout_button()
 
     # Version & UptimeRobot Link
@@ -278,32 +296,6 @@ with st.sidebar:
 # PAGE ROUTING
 # ═══════════════════════════════════════════════════════════════════════════════
 
-if page == "🏠 Home":
-    from dashboard.views.home import render_home_page
-
-    render_home_page(config, db)
-
-elif page == "🚀 Setup Guide":
-    from dashboard.views.setup_guide import render_setup_guide
-
-    render_setup_guide(config, db)
-
-elif page == "⚙️ Configuration":
-    from dashboard.views.config_page import render_config_page
-
-    render_config_page(config, db)
-
-elif page == "📡 Sources":
-    from dashboard.views.sources import render_sources_page
-
-    render_sources_page(config, db)
-
-elif page == "🤖 Telegram Bot":
-    from dashboard.views.telegram_bot import render_telegram_bot_page
-
-    render_telegram_bot_page(config, db)
-
-elif page == "📝 Logs":
-    from dashboard.views.logs import render_logs_page
-
-    render_logs_page(config, db)
+# Only the selected page's module is imported (see dashboard.views.__getattr__)
+render_page = getattr(views, PAGES[page])
+render_page(config, db)
@@ -1,3 +1,26 @@
 """
 Dashboard Pages Package
 """
+# Page modules are imported lazily (PEP 562) so a session only loads the
+# page it renders (and that page's heavy deps, e.g. pandas).
+import importlib
+
+_LAZY = {
+    "render_home_page": ".home",
+    "render_setup_guide": ".setup_guide",
+    "render_config_page": ".config_page",
+    "render_sources_page": ".sources",
+    "render_telegram_bot_page": ".telegram_bot",
+    "render_logs_page": ".logs",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
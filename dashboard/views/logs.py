@@ -7,7 +7,7 @@ Premium log viewer with filtering and real-time updates.
 import streamlit as st
 from datetime import datetime, timedelta
 
-from dashboard.components import render_log_entry
+from dashboard.components import render_log_entries
 
 
 def render_logs_page(config, db):
@@ -240,9 +240,8 @@ def render_logs_page(config, db):
         return log.get(attr, default)
 
     if view_mode == "📋 Cards":
-        # Card view with styled entries
-        for log in logs:
-            render_log_entry(log)
+        # Card view with styled entries (one markdown element for the page)
+        render_log_entries(logs, limit=limit)
 
     elif view_mode == "📊 Table":
         # Table view
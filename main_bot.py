@@ -82,6 +82,9 @@ class ContentOrbitBot:
             status = self.config.get_config_status()
             logger.info(f"Config status: {status}")
 
+        # Pre-open publisher connections before the first (immediate) run
+        await self._warmup_publishers()
+
         # Initialize scheduler
         schedule = self.config.app_config.schedule
         if not schedule:
@@ -120,6 +123,17 @@ class ContentOrbitBot:
         # Keep running until shutdown
         await self._shutdown_event.wait()
 
+    async def _warmup_publishers(self):
+        """Establish DNS/TLS sessions to the configured publisher APIs"""
+        from core.publisher import BloggerPublisher, DevToPublisher
+
+        publishers = [
+            publisher
+            for publisher in (BloggerPublisher(self.config), DevToPublisher(self.config))
+            if publisher.is_configured()
+        ]
+        await asyncio.gather(*(publisher.warmup() for publisher in publishers))
+
     async def stop(self):
         """Stop the bot worker gracefully"""
         logger.info("🛑 Shutting down ContentOrbit...")
@@ -134,6 +148,9 @@ class ContentOrbitBot:
             component="bot", action="stop", message="Bot stopped gracefully"
         )
 
+        from core.publisher.http import close_shared_client
+
+        await close_shared_client()
         close_db()
         self._shutdown_event.set()
 
@@ -386,11 +403,14 @@ async def main():
             # Windows doesn't support add_signal_handler
             signal.signal(sig, lambda s, f: asyncio.create_task(bot.stop()))
 
-    # Start the bot
-    try:
-        await bot.start()
-    except KeyboardInterrupt:
-        await bot.stop()
+    from core.publisher.http import publisher_lifespan
+
+    # Start the bot (one pooled publisher HTTP client for its whole lifetime)
+    async with publisher_lifespan():
+        try:
+            await bot.start()
+        except KeyboardInterrupt:
+            await bot.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+"""AppConfig.from_raw caching."""
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from core.models import AppConfig  # noqa: E402
+
+
+def test_from_raw_edits_do_not_leak_into_later_loads():
+    raw = b'{"brand_name": "Orbit"}'
+
+    first = AppConfig.from_raw(raw)
+    first.brand_name = "EDITED"
+    second = AppConfig.from_raw(raw)
+
+    assert second is not first
+    assert second.brand_name == "Orbit"
+
+
+def test_from_raw_nested_models_are_not_shared():
+    raw = b'{"telegram": {"bot_token": "t", "channel_id": "@c"}}'
+
+    first = AppConfig.from_raw(raw)
+    first.telegram.admin_user_ids.append(1)
+
+    assert AppConfig.from_raw(raw).telegram.admin_user_ids == []
@@ -0,0 +1,95 @@
+"""Blogger access-token handling after the API rejects a token (401)."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic")
+pytest.importorskip("asyncio_throttle")
+
+from core.publisher.blogger_publisher import BloggerPublisher  # noqa: E402
+
+
+def _publisher(tmp_path):
+    blogger = SimpleNamespace(
+        blog_id="1",
+        client_id="client",
+        client_secret="secret",
+        refresh_token="refresh",
+        rate_limit=1,
+    )
+    config = SimpleNamespace(
+        config_path=tmp_path / "config.json",
+        app_config=SimpleNamespace(blogger=blogger),
+        is_configured=lambda platform: True,
+    )
+    publisher = BloggerPublisher(config)
+
+    async def refresh():
+        publisher._set_token("fresh", 3600)
+        return "fresh"
+
+    publisher._refresh_access_token = refresh
+    return publisher
+
+
+def test_rejected_token_in_file_cache_forces_refresh(tmp_path):
+    publisher = _publisher(tmp_path)
+
+    async def run():
+        await publisher._token_cache.set("client", "stale", time.time() + 3600)
+        publisher._set_token("stale", 3600)
+        publisher._invalidate_token()  # what a 401 does
+        return await publisher._get_access_token()
+
+    assert asyncio.run(run()) == "fresh"
+
+
+def test_other_cached_token_is_reused_after_401(tmp_path):
+    publisher = _publisher(tmp_path)
+
+    async def run():
+        publisher._set_token("stale", 3600)
+        publisher._invalidate_token()
+        # Another worker already refreshed to a different token
+        await publisher._token_cache.set("client", "rotated", time.time() + 3600)
+        return await publisher._get_access_token()
+
+    assert asyncio.run(run()) == "rotated"
+
+
+def test_token_cache_lock_does_not_block_event_loop(tmp_path):
+    fcntl = pytest.importorskip("fcntl")
+    publisher = _publisher(tmp_path)
+    cache = publisher._token_cache
+
+    async def run():
+        await cache.set("client", "cached", time.time() + 3600)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        # Another worker holds the file lock for a while
+        with open(cache.path, "r+") as held:
+            fcntl.flock(held, fcntl.LOCK_EX)
+            tick_task = asyncio.create_task(ticker())
+            lookup = asyncio.create_task(cache.get("client"))
+            await asyncio.sleep(0.2)
+            assert not lookup.done()
+            fcntl.flock(held, fcntl.LOCK_UN)
+
+        entry = await lookup
+        tick_task.cancel()
+        return entry, ticks
+
+    entry, ticks = asyncio.run(run())
+    assert entry[0] == "cached"
+    # The loop kept running while the lookup waited on the lock
+    assert ticks >= 5
@@ -0,0 +1,158 @@
+"""Concurrent and prefetched paging in the Dev.to and Blogger publishers."""
+
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic")
+pytest.importorskip("asyncio_throttle")
+
+from core.publisher.devto_publisher import DevToPublisher  # noqa: E402
+
+
+class _Pages:
+    """Fake `_fetch_articles_page` serving `total` articles"""
+
+    def __init__(self, total, fail_page=None):
+        self.total = total
+        self.fail_page = fail_page
+        self.requested = []
+        self.cancelled = []
+
+    async def __call__(self, page, per_page, state):
+        self.requested.append(page)
+        try:
+            # Later pages answer sooner, so completion order is scrambled
+            await asyncio.sleep(0.01 / page)
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        if page == self.fail_page:
+            raise RuntimeError("boom")
+        start = (page - 1) * per_page
+        return [{"id": i} for i in range(start, min(start + per_page, self.total))]
+
+
+def _publisher(pages):
+    publisher = DevToPublisher.__new__(DevToPublisher)
+    publisher.is_configured = lambda: True
+    publisher._fetch_articles_page = pages
+    return publisher
+
+
+async def _collect(publisher, **kwargs):
+    return [a["id"] async for a in publisher.iter_my_articles(**kwargs)]
+
+
+def test_yields_every_article_and_stops_at_short_page():
+    pages = _Pages(total=25)
+    ids = asyncio.run(_collect(_publisher(pages), per_page=10, concurrency=3))
+
+    assert sorted(ids) == list(range(25))
+    # Page 3 is short; nothing past the initial window is scheduled
+    assert max(pages.requested) == 3
+
+
+def test_failed_page_cancels_the_others():
+    pages = _Pages(total=1000, fail_page=4)
+
+    async def run():
+        ids = await _collect(_publisher(pages), per_page=10, concurrency=4)
+        await asyncio.sleep(0.05)
+        return ids
+
+    asyncio.run(run())
+    assert pages.cancelled
+    assert max(pages.requested) <= 4
+
+
+def test_early_exit_cancels_in_flight_pages():
+    pages = _Pages(total=1000)
+
+    async def run():
+        gen = _publisher(pages).iter_my_articles(per_page=10, concurrency=4)
+        await gen.__anext__()
+        await gen.aclose()
+
+    asyncio.run(run())
+    assert pages.cancelled
+
+
+# ─── Blogger: chained pages, one prefetched ahead ───
+
+
+class _BloggerPages:
+    """Fake `_fetch_posts_page` serving `count` chained pages of 2 posts"""
+
+    def __init__(self, count, fail_page=None):
+        self.count = count
+        self.fail_page = fail_page
+        self.cancelled = []
+        self.finished = []
+
+    async def __call__(self, token, per_page):
+        page = int(token or 0)
+        try:
+            await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        self.finished.append(page)
+        if page == self.fail_page:
+            raise RuntimeError("boom")
+        data = {"items": [{"id": f"{page}-{i}"} for i in range(2)]}
+        if page + 1 < self.count:
+            data["nextPageToken"] = str(page + 1)
+        return data
+
+
+def _blogger(pages):
+    from core.publisher.blogger_publisher import BloggerPublisher
+
+    publisher = BloggerPublisher.__new__(BloggerPublisher)
+    publisher.is_configured = lambda: True
+    publisher._fetch_posts_page = pages
+    return publisher
+
+
+def test_blogger_yields_every_post():
+    async def run():
+        return [p["id"] async for p in _blogger(_BloggerPages(3)).iter_all_posts()]
+
+    assert len(asyncio.run(run())) == 6
+
+
+def test_blogger_early_exit_cancels_and_awaits_prefetch():
+    pages = _BloggerPages(10)
+
+    async def run():
+        gen = _blogger(pages).iter_all_posts()
+        await gen.__anext__()
+        await asyncio.sleep(0)  # let the prefetch start
+        await gen.aclose()
+        # Nothing is left running once the generator has closed
+        assert all(t is asyncio.current_task() for t in asyncio.all_tasks())
+
+    asyncio.run(run())
+    assert pages.cancelled == [1]
+
+
+def test_blogger_failed_prefetch_is_retrieved():
+    pages = _BloggerPages(10, fail_page=1)
+    unhandled = []
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+        gen = _blogger(pages).iter_all_posts()
+        await gen.__anext__()
+        await asyncio.sleep(0.05)  # prefetch of page 1 fails meanwhile
+        await gen.aclose()
+
+    asyncio.run(run())
+    gc.collect()
+    assert pages.finished == [0, 1]
+    assert not unhandled
@@ -0,0 +1,40 @@
+"""Dev.to tag cleaning."""
+
+import random
+import re
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic")
+pytest.importorskip("asyncio_throttle")
+
+from core.publisher.devto_publisher import DevToPublisher  # noqa: E402
+
+
+def _reference(tag):
+    """The regex-based cleaning _clean_tag replaced"""
+    tag = re.sub(r"[^a-z0-9\-]", "", tag.lower().strip().replace(" ", "-"))
+    return re.sub(r"-+", "-", tag)[:20]
+
+
+@pytest.mark.parametrize(
+    "tag, expected",
+    [
+        ("Machine Learning", "machine-learning"),
+        ("  C++ / Go  ", "c-go"),
+        ("Kubernetes", "kubernetes"),  # Kelvin sign lowercases to "k"
+        ("İOS", "ios"),  # dotted capital I lowercases to "i" + combining dot
+        ("ذكاء اصطناعي", "-"),
+    ],
+)
+def test_clean_tag(tag, expected):
+    assert DevToPublisher._clean_tag(None, tag) == expected
+
+
+def test_clean_tag_matches_reference():
+    rng = random.Random(0)
+    alphabet = "aZ9 -_+.KİÉéا\t"
+    for _ in range(2000):
+        tag = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert DevToPublisher._clean_tag(None, tag) == _reference(tag), repr(tag)
@@ -0,0 +1,86 @@
+"""Fallbacks when FacebookPublisher's multi-photo batch request fails."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("orjson")
+pytest.importorskip("pydantic")
+pytest.importorskip("asyncio_throttle")
+
+from core.publisher.facebook_publisher import FacebookPublisher  # noqa: E402
+
+URLS = ["https://img.example.com/a.jpg", "https://img.example.com/b.jpg"]
+
+
+class _Graph:
+    """Fake Graph API recording the calls per endpoint"""
+
+    def __init__(self, batch):
+        self.batch = batch
+        self.calls = []
+
+    def __call__(self, request):
+        form = parse_qs(request.content.decode())
+        path = request.url.path.rsplit("/", 1)[-1]
+        self.calls.append((path, form))
+        if path == "v18.0":
+            return self.batch(request)
+        if path == "photos":
+            return httpx.Response(200, json={"id": "new", "post_id": "photo_post"})
+        return httpx.Response(200, json={"id": "feed_post"})
+
+    def paths(self):
+        return [path for path, _ in self.calls]
+
+
+def _publisher(graph):
+    facebook = SimpleNamespace(page_id="page", page_access_token="token")
+    config = SimpleNamespace(
+        app_config=SimpleNamespace(facebook=facebook),
+        is_configured=lambda platform: True,
+    )
+    client = httpx.AsyncClient(transport=httpx.MockTransport(graph))
+    return FacebookPublisher(config, client=client)
+
+
+def _ok(body):
+    return {"code": 200, "body": json.dumps(body)}
+
+
+def test_failed_batch_reuses_uploaded_photos():
+    error = {"code": 400, "body": json.dumps({"error": {"message": "bad image"}})}
+    results = [_ok({"id": "p0"}), error, None]
+    graph = _Graph(lambda request: httpx.Response(200, json=results))
+
+    post_id = asyncio.run(_publisher(graph).publish_photos("hi", URLS))
+
+    assert post_id == "feed_post"
+    # Only the photo that failed in the batch is uploaded again
+    assert graph.paths() == ["v18.0", "photos", "feed"]
+    assert graph.calls[1][1]["url"] == [URLS[1]]
+    feed = graph.calls[2][1]
+    assert feed["attached_media[0]"] == ['{"media_fbid":"p0"}']
+    assert feed["attached_media[1]"] == ['{"media_fbid":"new"}']
+
+
+def test_batch_timeout_does_not_post_again():
+    def batch(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    graph = _Graph(batch)
+    assert asyncio.run(_publisher(graph).publish_photos("hi", URLS)) is None
+    assert graph.paths() == ["v18.0"]
+
+
+def test_rejected_batch_falls_back_to_single_photo():
+    graph = _Graph(lambda request: httpx.Response(400, json={"error": {"code": 100}}))
+
+    post_id = asyncio.run(_publisher(graph).publish_photos("hi", URLS))
+
+    assert post_id == "photo_post"
+    assert graph.paths() == ["v18.0", "photos"]
@@ -0,0 +1,101 @@
+"""Facebook Graph API usage-header back-off."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("orjson")
+pytest.importorskip("pydantic")
+pytest.importorskip("asyncio_throttle")
+
+from core.publisher import facebook_publisher  # noqa: E402
+from core.publisher.facebook_publisher import (  # noqa: E402
+    FacebookPublisher,
+    FacebookThrottledError,
+)
+
+
+def _publisher(handler, page_id="page"):
+    facebook = SimpleNamespace(page_id=page_id, page_access_token="token")
+    config = SimpleNamespace(
+        app_config=SimpleNamespace(facebook=facebook),
+        is_configured=lambda platform: True,
+    )
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return FacebookPublisher(config, client=client)
+
+
+@pytest.fixture(autouse=True)
+def _clear_pauses():
+    facebook_publisher._pause_until.clear()
+    yield
+    facebook_publisher._pause_until.clear()
+
+
+def test_long_pause_fails_fast_instead_of_sleeping():
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={"id": "1"})
+
+    publisher = _publisher(handler)
+    facebook_publisher._pause_until["page"] = time.monotonic() + 3600
+
+    async def run():
+        with pytest.raises(FacebookThrottledError):
+            await asyncio.wait_for(publisher._request("GET", publisher._page_url), 1)
+        return await publisher.publish_post("hello")
+
+    assert asyncio.run(run()) is None
+    assert not sent
+
+
+def test_probe_calls_skip_the_pause():
+    publisher = _publisher(lambda request: httpx.Response(200, json={"data": {}}))
+    facebook_publisher._pause_until["page"] = time.monotonic() + 3600
+
+    async def run():
+        return await asyncio.wait_for(
+            publisher._request("GET", publisher._debug_token_url, probe=True), 1
+        )
+
+    assert asyncio.run(run()).status_code == 200
+
+
+def test_regain_access_header_pauses_the_page():
+    usage = '{"estimated_time_to_regain_access": 1440, "call_count": 100}'
+    publisher = _publisher(
+        lambda request: httpx.Response(200, headers={"x-page-usage": usage}, json={})
+    )
+
+    asyncio.run(publisher._request("GET", publisher._page_url))
+    remaining = facebook_publisher._pause_until["page"] - time.monotonic()
+    assert remaining > facebook_publisher._USAGE_PAUSE_CAP
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("x-page-usage", "[1, 2]"),
+        ("x-page-usage", '"high"'),
+        ("x-page-usage", '{"call_count": "lots"}'),
+        ("x-business-use-case-usage", '{"123": {"call_count": 99}}'),
+        ("x-business-use-case-usage", '{"123": [42, null]}'),
+        ("x-app-usage", "not json"),
+    ],
+)
+def test_malformed_usage_headers_are_ignored(name, value):
+    assert facebook_publisher._usage_pause(httpx.Headers({name: value})) == 0.0
+
+
+def test_malformed_usage_header_does_not_fail_a_published_post():
+    publisher = _publisher(
+        lambda request: httpx.Response(
+            200, headers={"x-business-use-case-usage": "[1]"}, json={"id": "42"}
+        )
+    )
+    assert asyncio.run(publisher.publish_post("hello")) == "42"
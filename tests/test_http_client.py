@@ -0,0 +1,44 @@
+"""Per-event-loop shared publisher HTTP client."""
+
+import asyncio
+import gc
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("asyncio_throttle")
+
+from core.publisher import http  # noqa: E402
+
+
+def test_each_loop_gets_its_own_client():
+    async def grab():
+        return http.get_shared_client(), http.get_shared_client()
+
+    first_a, first_b = asyncio.run(grab())
+    second, _ = asyncio.run(grab())
+
+    assert first_a is first_b
+    assert second is not first_a
+
+
+def test_close_shared_client_closes_the_running_loops_client():
+    async def run():
+        client = http.get_shared_client()
+        await http.close_shared_client()
+        return client, http.get_shared_client()
+
+    closed, fresh = asyncio.run(run())
+    assert closed.is_closed
+    assert fresh is not closed
+
+
+def test_dropping_an_unclosed_client_is_logged(caplog):
+    async def grab():
+        http.get_shared_client()
+
+    with caplog.at_level("WARNING", logger=http.__name__):
+        asyncio.run(grab())
+        gc.collect()
+
+    assert "leaked" in caplog.text
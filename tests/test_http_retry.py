@@ -0,0 +1,34 @@
+"""Retry policy for non-idempotent publisher requests."""
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("asyncio_throttle")
+
+from core.publisher.http import is_retryable_write  # noqa: E402
+
+
+def _status_error(code, headers=None, content=b""):
+    request = httpx.Request("POST", "https://api.example.com/posts")
+    response = httpx.Response(code, headers=headers, content=content, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    "code, headers, expected",
+    [
+        (429, None, True),
+        (503, {"Retry-After": "5"}, True),
+        (503, None, False),
+        (502, None, False),
+        (504, None, False),
+        (500, None, False),
+        (408, None, False),
+    ],
+)
+def test_is_retryable_write(code, headers, expected):
+    assert is_retryable_write(_status_error(code, headers)) is expected
+
+
+def test_transport_errors_are_not_retried():
+    assert not is_retryable_write(httpx.ReadTimeout("timed out"))
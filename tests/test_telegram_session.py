@@ -0,0 +1,35 @@
+"""Tuned aiohttp session used by the Telegram publisher's Bot."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiogram")
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic")
+
+from core.publisher.telegram_publisher import _BotSession  # noqa: E402
+
+
+def test_session_uses_tuned_connector_and_is_reused():
+    async def run():
+        session = _BotSession(limit=10, limit_per_host=3)
+        client = await session.create_session()
+        again = await session.create_session()
+        await session.close()
+        return client, again
+
+    client, again = asyncio.run(run())
+    assert client is again
+    assert client.closed
+
+
+def test_connector_limits():
+    async def run():
+        session = _BotSession(limit=10, limit_per_host=3)
+        client = await session.create_session()
+        limits = client.connector.limit, client.connector.limit_per_host
+        await session.close()
+        return limits
+
+    assert asyncio.run(run()) == (10, 3)